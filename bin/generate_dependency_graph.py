@@ -13,12 +13,19 @@ It will create a DOT file at roo-registry/doc/dependencies.dot that shows:
 - Modules with outdated dependencies have red outlines (when --show_outdated is not specified)
 """
 
+import atexit
+import functools
+import os
+import re
 import sys
 import subprocess
 import json
 import argparse
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 # Check for GitPython availability
 try:
@@ -29,6 +36,13 @@ except ImportError:
         "Install it with: pip install GitPython"
     )
 
+# orjson is an optional accelerator for library.json parsing; the stdlib json
+# module is used when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration: Modules to ignore in dependency analysis
 # Add module names to this list to exclude them from the dependency graph
 IGNORED_MODULES = [
@@ -37,22 +51,71 @@ IGNORED_MODULES = [
     # Example: 'another_module_to_ignore',
 ]
 
+# Frozen copy for the membership tests; should_ignore_module sits on the inner
+# loops of dependency filtering, and a set lookup beats a list scan there.
+_IGNORED_MODULES = frozenset(IGNORED_MODULES)
+
+# library.json version constraints (e.g. ">0", ">=1.0.0"): one precompiled
+# match splits off the optional operator instead of a startswith ladder per
+# dependency.
+_VERSION_CONSTRAINT_PATTERN = re.compile(r'^(>=|>|=)?(.*)$')
+# Bare-version equivalents of "any version"; mapped to a minimum version.
+_ZERO_VERSIONS = frozenset(["0", ""])
+# Constraints that just mean "any version"; parse failures on these are
+# expected and not worth a warning.
+_ANY_VERSION_CONSTRAINTS = frozenset([">0", ">=0", ">0.0", ">=0.0"])
+
 # Add the bin directory to the path to import module_utils
 sys.path.insert(0, str(Path(__file__).parent))
 from module_utils import Version, Dependency, parse_module_bazel
 
 
+def load_library_json(library_json_path: Path) -> dict:
+    """
+    Load and parse a library.json file.
+
+    Parses are memoized per (path, mtime, size): the untracked-module pass and
+    the untracked-dependency pass read the same files, so the second read hits
+    the cache.
+    """
+    stat = os.stat(library_json_path)
+    return _load_library_json_cached(
+        os.fspath(library_json_path), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_library_json_cached(library_json_path: str, mtime_ns: int, size: int) -> dict:
+    if orjson is not None:
+        with open(library_json_path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(library_json_path, "r") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def _version(version_str: str) -> Version:
+    """
+    Shared Version instances keyed by the raw string.
+
+    The same handful of version strings shows up across many version
+    directories and dependency edges, so repeated construction collapses to a
+    cache hit. Version objects are immutable in practice, so sharing is safe.
+    """
+    return Version(version_str)
+
+
 def should_ignore_module(module_name: str) -> bool:
     """Check if a module should be ignored based on the IGNORED_MODULES list."""
-    # Extract the actual module name from various formats
-    clean_name = module_name
+    # Common case: a plain module name, resolved with a single set lookup.
+    if module_name in _IGNORED_MODULES:
+        return True
 
-    # Remove path prefixes if present
-    if "/" in clean_name:
-        clean_name = clean_name.split("/")[-1]
+    # Remove path prefixes if present (e.g. "dejwk/roo_foo")
+    if "/" in module_name:
+        return module_name.rsplit("/", 1)[-1] in _IGNORED_MODULES
 
-    # Check if the module name matches any ignored module
-    return clean_name in IGNORED_MODULES
+    return False
 
 
 def get_modules_and_versions(modules_dir: Path) -> Dict[str, List[Version]]:
@@ -65,132 +128,123 @@ def get_modules_and_versions(modules_dir: Path) -> Dict[str, List[Version]]:
     if not modules_dir.exists():
         return modules
 
-    for module_path in modules_dir.iterdir():
-        if module_path.is_dir() and module_path.name.startswith("roo_"):
-            module_name = module_path.name
-
-            # Skip ignored modules
-            if should_ignore_module(module_name):
-                print(f"Ignoring module: {module_name}")
-                continue
-
-            versions = []
-
-            for version_path in module_path.iterdir():
-                if version_path.is_dir():
-                    try:
-                        version = Version(version_path.name)
-                        versions.append(version)
-                    except ValueError:
-                        # Skip invalid version directories
-                        continue
-
-            if versions:
-                modules[module_name] = sorted(versions, reverse=True)
+    # os.scandir reuses the directory entry type from readdir, avoiding a
+    # stat() call per entry that Path.is_dir() would incur.
+    with os.scandir(modules_dir) as module_entries:
+        for module_entry in module_entries:
+            if module_entry.is_dir(follow_symlinks=False) and module_entry.name.startswith("roo_"):
+                module_name = module_entry.name
+
+                # Skip ignored modules
+                if should_ignore_module(module_name):
+                    print(f"Ignoring module: {module_name}")
+                    continue
+
+                versions = []
+
+                with os.scandir(module_entry.path) as version_entries:
+                    for version_entry in version_entries:
+                        if version_entry.is_dir(follow_symlinks=False):
+                            try:
+                                version = _version(version_entry.name)
+                                versions.append(version)
+                            except ValueError:
+                                # Skip invalid version directories
+                                continue
+
+                if versions:
+                    # No need to sort: downstream only takes max(versions).
+                    modules[module_name] = versions
 
     return modules
 
 
-def get_untracked_modules(
+def scan_untracked_modules(
     registry_dir: Path, registry_modules: Dict[str, List[Version]]
-) -> Dict[str, Version]:
+) -> Tuple[Dict[str, Version], Dict[str, List[Dependency]]]:
     """
-    Get all untracked roo_* directories that are not in the registry.
-    Returns a dict mapping module name to its version from MODULE.bazel or library.json.
+    Scan for untracked roo_* directories that are not in the registry.
+
+    Versions and dependencies are collected in the same pass, so each
+    candidate directory is walked once and each MODULE.bazel / library.json is
+    consulted once.
+
+    Returns a tuple (untracked_modules, untracked_dependencies) mapping module
+    names to their version and to their list of dependencies, respectively.
     """
     untracked = {}
+    all_deps = {}
     parent_dir = registry_dir.parent
 
     if not parent_dir.exists():
-        return untracked
-
-    for untracked_path in parent_dir.iterdir():
-        if (
-            untracked_path.is_dir()
-            and untracked_path.name.startswith("roo_")
-            and untracked_path != registry_dir
-            and untracked_path.name not in registry_modules
-        ):  # Only include if NOT in registry
-
-            # Skip ignored modules
-            if should_ignore_module(untracked_path.name):
-                print(f"Ignoring untracked module: {untracked_path.name}")
-                continue
-
-            module_bazel_path = untracked_path / "MODULE.bazel"
-            library_json_path = untracked_path / "library.json"
-
-            # Try MODULE.bazel first
-            if module_bazel_path.exists():
-                try:
-                    module_name, version_str, _ = parse_module_bazel(module_bazel_path)
-                    if version_str:
-                        version = Version(version_str)
-                        untracked[untracked_path.name] = version
-                        continue
-                except Exception as e:
-                    print(f"Warning: Failed to parse {module_bazel_path}: {e}")
-
-            # Fall back to library.json
-            if library_json_path.exists():
-                try:
-                    import json
+        return untracked, all_deps
+
+    registry_name = registry_dir.name
+    with os.scandir(parent_dir) as entries:
+        untracked_entries = [
+            entry
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+            and entry.name.startswith("roo_")
+            and entry.name != registry_name
+            and entry.name not in registry_modules
+        ]  # Only include if NOT in registry
+
+    for entry in untracked_entries:
+        module_name = entry.name
+
+        # Skip ignored modules
+        if should_ignore_module(module_name):
+            print(f"Ignoring untracked module: {module_name}")
+            continue
+
+        # Plain string joins: entry.path is already a string, and these paths
+        # only feed the (string-keyed) cached parsers and existence checks, so
+        # there is no reason to pay for Path construction per candidate.
+        module_bazel_path = os.path.join(entry.path, "MODULE.bazel")
+        library_json_path = os.path.join(entry.path, "library.json")
+
+        version = None
+        dependencies = []
 
-                    with open(library_json_path, "r") as f:
-                        library_data = json.load(f)
+        # Try MODULE.bazel first, for both the version and the dependencies
+        if os.path.exists(module_bazel_path):
+            try:
+                _, version_str, dependencies = parse_module_bazel(module_bazel_path)
+                if version_str:
+                    version = _version(version_str)
+            except Exception as e:
+                print(f"Warning: Failed to parse {module_bazel_path}: {e}")
+                dependencies = []
 
-                    version_str = library_data.get("version")
-                    if version_str:
-                        version = Version(version_str)
-                        untracked[untracked_path.name] = version
-                        print(
-                            f"Note: {untracked_path.name} uses library.json version (no MODULE.bazel)"
-                        )
-                        continue
-                except Exception as e:
-                    print(f"Warning: Failed to parse {library_json_path}: {e}")
+        # Fall back to library.json for the version
+        if version is None and os.path.exists(library_json_path):
+            try:
+                library_data = load_library_json(library_json_path)
+
+                version_str = library_data.get("version")
+                if version_str:
+                    version = _version(version_str)
+                    print(
+                        f"Note: {module_name} uses library.json version (no MODULE.bazel)"
+                    )
+            except Exception as e:
+                print(f"Warning: Failed to parse {library_json_path}: {e}")
 
-            # If we get here, the module has no parseable version info
+        if version is None:
+            # The module has no parseable version info; its dependencies are
+            # not recorded either.
             print(
-                f"Warning: {untracked_path.name} has no MODULE.bazel or library.json with version"
+                f"Warning: {module_name} has no MODULE.bazel or library.json with version"
             )
+            continue
 
-    return untracked
-
-
-def get_untracked_dependencies(
-    registry_dir: Path, untracked_modules: Dict[str, Version]
-) -> Dict[str, List[Dependency]]:
-    """
-    Get dependencies for all untracked modules.
-    Returns a dict mapping module name to list of dependencies.
-    """
-    all_deps = {}
-    parent_dir = registry_dir.parent
-
-    for module_name in untracked_modules:
-        untracked_path = parent_dir / module_name
-        module_bazel_path = untracked_path / "MODULE.bazel"
-        library_json_path = untracked_path / "library.json"
-
-        dependencies = []
-
-        # Try MODULE.bazel first
-        if module_bazel_path.exists():
-            try:
-                _, _, dependencies = parse_module_bazel(module_bazel_path)
-            except Exception as e:
-                print(
-                    f"Warning: Failed to parse dependencies from {module_bazel_path}: {e}"
-                )
+        untracked[module_name] = version
 
         # Fall back to library.json if no MODULE.bazel or no dependencies found
-        if not dependencies and library_json_path.exists():
+        if not dependencies and os.path.exists(library_json_path):
             try:
-                import json
-
-                with open(library_json_path, "r") as f:
-                    library_data = json.load(f)
+                library_data = load_library_json(library_json_path)
 
                 deps_dict = library_data.get("dependencies", {})
                 for dep_name, version_constraint in deps_dict.items():
@@ -209,31 +263,22 @@ def get_untracked_dependencies(
 
                     # Parse version constraint (e.g., ">0", ">=1.0.0")
                     # For simplicity, we'll use a minimum version for constraint-only deps
-                    if version_constraint.startswith(">="):
-                        version_str = version_constraint[2:]
-                    elif version_constraint.startswith(">"):
-                        version_part = version_constraint[1:]
-                        if version_part == "0":
-                            version_str = "0.0.1"  # Use minimum version for ">0"
-                        else:
-                            version_str = version_part
-                    elif version_constraint.startswith("="):
-                        version_str = version_constraint[1:]
-                    else:
-                        version_str = version_constraint
+                    version_str = _VERSION_CONSTRAINT_PATTERN.match(
+                        version_constraint
+                    ).group(2)
 
                     # Handle special cases
-                    if version_str in ["0", ""]:
+                    if version_str in _ZERO_VERSIONS:
                         version_str = "0.0.1"  # Use minimum version for "0" or empty
 
                     try:
-                        version = Version(version_str)
+                        version = _version(version_str)
                         dependency = Dependency(clean_name, version)
                         dependencies.append(dependency)
                     except Exception as e:
                         # For ">0" and similar constraints, skip the dependency rather than warn
                         # since these are often just "any version" constraints
-                        if version_constraint not in [">0", ">=0", ">0.0", ">=0.0"]:
+                        if version_constraint not in _ANY_VERSION_CONSTRAINTS:
                             print(
                                 f"Warning: Could not parse version '{version_constraint}' for dependency '{clean_name}' in {module_name}: {e}"
                             )
@@ -244,33 +289,23 @@ def get_untracked_dependencies(
                 )
 
         # Filter out ignored modules from the final dependencies list
-        filtered_dependencies = []
-        for dep in dependencies:
-            if not should_ignore_module(dep.name):
-                filtered_dependencies.append(dep)
-            else:
-                print(
-                    f"Filtering out ignored dependency: {dep.name} from {module_name}"
-                )
-
-        all_deps[module_name] = filtered_dependencies
+        all_deps[module_name] = filter_ignored_dependencies(module_name, dependencies)
 
-    return all_deps
+    return untracked, all_deps
 
 
-def find_newest_versions(modules: Dict[str, List[Version]]) -> Dict[str, Version]:
-    """
-    Given a dictionary of modules and their versions, return a dictionary
-    mapping module names to their newest version.
-    """
-    newest_versions = {}
-
-    for module_name, versions in modules.items():
-        if versions:
-            # Get the highest version (last in sorted list)
-            newest_versions[module_name] = max(versions)
+def filter_ignored_dependencies(
+    module_name: str, dependencies: List[Dependency]
+) -> List[Dependency]:
+    """Filter out ignored modules from a module's dependency list."""
+    filtered_dependencies = []
+    for dep in dependencies:
+        if not should_ignore_module(dep.name):
+            filtered_dependencies.append(dep)
+        else:
+            print(f"Filtering out ignored dependency: {dep.name} from {module_name}")
 
-    return newest_versions
+    return filtered_dependencies
 
 
 def get_module_dependencies(
@@ -279,18 +314,14 @@ def get_module_dependencies(
     """
     Get the dependencies for a specific module version by parsing its MODULE.bazel file.
     """
-    module_bazel_path = modules_dir / module_name / str(version) / "MODULE.bazel"
+    # A single os.path.join instead of chained `/` operators, which would
+    # allocate an intermediate PurePath per component.
+    module_bazel_path = Path(
+        os.path.join(os.fspath(modules_dir), module_name, str(version), "MODULE.bazel")
+    )
     _, _, dependencies = parse_module_bazel(module_bazel_path)
 
-    # Filter out ignored modules from dependencies
-    filtered_dependencies = []
-    for dep in dependencies:
-        if not should_ignore_module(dep.name):
-            filtered_dependencies.append(dep)
-        else:
-            print(f"Filtering out ignored dependency: {dep.name} from {module_name}")
-
-    return filtered_dependencies
+    return filter_ignored_dependencies(module_name, dependencies)
 
 
 def get_all_dependencies(
@@ -301,11 +332,29 @@ def get_all_dependencies(
 
     Returns a dictionary mapping module names to their list of dependencies.
     """
-    all_dependencies = {}
-
-    for module_name, version in newest_versions.items():
-        dependencies = get_module_dependencies(modules_dir, module_name, version)
-        all_dependencies[module_name] = dependencies
+    items = list(newest_versions.items())
+
+    # Parsing one MODULE.bazel per module is embarrassingly parallel and
+    # dominated by file reads, so fan it out over a thread pool. For a handful
+    # of modules the pool startup cost outweighs the win, so stay serial.
+    if len(items) < 8:
+        return {
+            module_name: get_module_dependencies(modules_dir, module_name, version)
+            for module_name, version in items
+        }
+
+    modules_dir_str = os.fspath(modules_dir)
+    paths = [
+        Path(os.path.join(modules_dir_str, module_name, str(version), "MODULE.bazel"))
+        for module_name, version in items
+    ]
+
+    with ThreadPoolExecutor() as executor:
+        parsed = executor.map(parse_module_bazel, paths)
+        all_dependencies = {
+            module_name: filter_ignored_dependencies(module_name, dependencies)
+            for (module_name, _), (_, _, dependencies) in zip(items, parsed)
+        }
 
     return all_dependencies
 
@@ -335,35 +384,8 @@ def check_dependency_versions(
     return checked_dependencies
 
 
-def find_modules_with_outdated_deps(
-    all_dependencies: Dict[str, List[Dependency]], newest_versions: Dict[str, Version]
-) -> Set[str]:
-    """
-    Find all modules that have at least one outdated dependency.
-    
-    Returns a set of module names that have outdated dependencies.
-    """
-    modules_with_outdated = set()
-    
-    for module in all_dependencies:
-        dependencies = all_dependencies[module]
-        checked_deps = check_dependency_versions(dependencies, newest_versions)
-        
-        for dep, is_latest in checked_deps:
-            # Only consider roo modules
-            if dep.name not in newest_versions:
-                continue
-            
-            # If we find any outdated dependency, mark this module
-            if not is_latest:
-                modules_with_outdated.add(module)
-                break  # No need to check other dependencies
-    
-    return modules_with_outdated
-
-
 def find_redundant_dependencies(
-    all_dependencies: Dict[str, List[Dependency]], 
+    checked_dependencies: Dict[str, List[Tuple[Dependency, bool]]],
     newest_versions: Dict[str, Version],
     keep_outdated: bool = False
 ) -> Set[Tuple[str, str]]:
@@ -379,75 +401,128 @@ def find_redundant_dependencies(
     """
     redundant_deps = set()
 
-    def has_path_through_deps(
-        start: str, target: str, original_start: str, visited: Set[str], only_updated: bool
-    ) -> bool:
-        """
-        Check if there's a path from start to target.
-        If only_updated is True, use only up-to-date dependencies.
-        If only_updated is False, use any dependencies.
-        original_start is used to identify the direct edge we want to exclude.
-        """
-        if start in visited:
-            return False
-
-        visited.add(start)
-
-        # Get dependencies of the current module
-        deps = all_dependencies.get(start, [])
+    # When keep_outdated is True, alternative paths may only use up-to-date
+    # dependencies; otherwise any roo dependency edge is usable.
+    only_updated = keep_outdated
+
+    # Map module names to dense integer ids so the traversal below runs over
+    # flat integer arrays instead of hashing strings and chasing attributes.
+    id_of = {name: i for i, name in enumerate(newest_versions)}
+    for name in checked_dependencies:
+        if name not in id_of:
+            id_of[name] = len(id_of)
+    num_modules = len(id_of)
+
+    # Build a CSR-style adjacency (indptr/indices) over the usable roo edges
+    # once, instead of re-filtering the dependency lists on every traversal
+    # step. Node i's neighbors are indices[indptr[i]:indptr[i + 1]].
+    indptr = [0] * (num_modules + 1)
+    indices: List[int] = []
+    for name, node in id_of.items():
+        for dep, is_latest in checked_dependencies.get(name, []):
+            # Only consider roo modules; if we require only updated paths,
+            # also skip outdated edges.
+            if dep.name in newest_versions and not (only_updated and not is_latest):
+                indices.append(id_of[dep.name])
+        indptr[node + 1] = len(indices)
+
+    # No usable edges at all (e.g. every dependency outdated while
+    # keep_outdated is set) means no path can bypass anything; skip the
+    # whole reachability pass.
+    if not indices:
+        return redundant_deps
+
+    # Single visited mask reused across sources; clearing it in place avoids
+    # reallocating per BFS.
+    visited = bytearray(num_modules)
+    clear_mask = bytes(num_modules)
+
+    # One BFS per source: compute everything reachable from the source via a
+    # path of length >= 2 in the usable subgraph (the standard transitive-
+    # reduction insight for DAGs). Every direct edge whose target lands in
+    # that set has an alternative path and is therefore redundant.
+    for module, checked_deps in checked_dependencies.items():
+        source = id_of[module]
+        direct_targets = indices[indptr[source]:indptr[source + 1]]
+
+        # With at most one usable direct edge there is nothing to bypass
+        # through: an alternative path would have to start with a different
+        # direct edge. Many modules have 0-1 roo dependencies, so this skips
+        # the BFS entirely for them.
+        if len(direct_targets) <= 1:
+            continue
+
+        visited[:] = clear_mask
+        visited[source] = 1
+
+        # Seed with the length-2 frontier (out-neighbors of out-neighbors);
+        # the direct edges themselves are deliberately not marked visited, so
+        # a direct target only ends up visited if some longer path reaches it.
+        queue = deque()
+        for target in direct_targets:
+            queue.extend(indices[indptr[target]:indptr[target + 1]])
+
+        while queue:
+            node = queue.popleft()
+            if visited[node]:
+                continue
+            visited[node] = 1
+            queue.extend(indices[indptr[node]:indptr[node + 1]])
 
-        for dep in deps:
+        for dep, is_latest in checked_deps:
             # Only consider roo modules
             if dep.name not in newest_versions:
                 continue
 
-            # Skip the direct edge we're testing for redundancy
-            if start == original_start and dep.name == target:
-                continue
-
-            # Check if this dependency is up-to-date
-            latest_version = newest_versions[dep.name]
-            is_up_to_date = dep.version == latest_version
-
-            # If we require only updated paths and this dep is outdated, skip it
-            if only_updated and not is_up_to_date:
+            # Old behavior (keep_outdated=True): only check up-to-date
+            # dependencies for redundancy. New behavior: check all of them.
+            if keep_outdated and not is_latest:
                 continue
 
-            # If we reached the target, we found a path
-            if dep.name == target:
-                return True
+            if visited[id_of[dep.name]]:
+                redundant_deps.add((module, dep.name))
 
-            # Recursively check if we can reach target from this dependency
-            if has_path_through_deps(
-                dep.name, target, original_start, visited.copy(), only_updated
-            ):
-                return True
-
-        return False
-
-    # Check each direct dependency to see if it's redundant
-    for module in all_dependencies:
-        dependencies = all_dependencies[module]
-        checked_deps = check_dependency_versions(dependencies, newest_versions)
-
-        for dep, is_latest in checked_deps:
-            # Only consider roo modules
-            if dep.name not in newest_versions:
-                continue
+    return redundant_deps
 
-            if keep_outdated:
-                # Old behavior: Only check up-to-date dependencies for redundancy
-                if is_latest:
-                    # Check if there's an alternative path through other up-to-date dependencies
-                    if has_path_through_deps(module, dep.name, module, set(), only_updated=True):
-                        redundant_deps.add((module, dep.name))
-            else:
-                # New behavior: Check all dependencies for redundancy (regardless of version)
-                # Check if there's an alternative path through any dependencies
-                if has_path_through_deps(module, dep.name, module, set(), only_updated=False):
-                    redundant_deps.add((module, dep.name))
 
-    return redundant_deps
+# Cross-run cache of latest-tag resolutions, stored under the registry so
+# repeated invocations (e.g. while iterating on a single module) skip the
+# `for-each-ref` query for repositories whose tags haven't changed. Only the
+# tag resolution is cached: the dirty and ahead-of-remote checks depend on
+# working-tree and remote state that no cheap fingerprint captures, so they
+# are recomputed on every run. Entries are keyed by module name and
+# fingerprinted by the tag refs state; see _resolve_latest_tag.
+_GIT_TAG_CACHE_PATH = Path(__file__).parent.parent / ".cache" / "git-tags.json"
+_git_tag_cache: Optional[Dict[str, list]] = None
+_git_tag_cache_lock = threading.Lock()
+_git_tag_cache_dirty = False
+
+
+def _get_git_tag_cache() -> Dict[str, list]:
+    """Load the on-disk tag cache on first use."""
+    global _git_tag_cache
+    with _git_tag_cache_lock:
+        if _git_tag_cache is None:
+            try:
+                with open(_GIT_TAG_CACHE_PATH, "r", encoding="utf-8") as f:
+                    _git_tag_cache = json.load(f)
+            except (OSError, ValueError):
+                _git_tag_cache = {}
+            atexit.register(_save_git_tag_cache)
+        return _git_tag_cache
+
+
+def _save_git_tag_cache() -> None:
+    """Write the tag cache back to disk if anything changed."""
+    if not _git_tag_cache_dirty:
+        return
+    try:
+        _GIT_TAG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_GIT_TAG_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(_git_tag_cache, f)
+    except OSError:
+        # A missing cache just means the next run recomputes everything.
+        pass
 
 
 def check_git_status(
@@ -462,6 +537,9 @@ def check_git_status(
     - UNPUBLISHED: synced with remote, HEAD matches a tag, but tag doesn't match current module version
     - CLEAN: synced with remote, HEAD matches a tag, and tag matches current module version
 
+    The dirty and ahead-of-remote checks run fresh on every call; only the
+    latest-tag resolution is cached across runs (see _resolve_latest_tag).
+
     Returns the status as a string.
     """
     try:
@@ -476,68 +554,12 @@ def check_git_status(
         # Initialize GitPython repo
         repo = git.Repo(module_dir)
 
-        # Check 1: Uncommitted changes (working directory dirty)
-        if repo.is_dirty(untracked_files=True):
-            return "DIRTY"  # Has uncommitted changes
-
-        # Check 2: Check if ahead of remote branch
-        try:
-            current_branch = repo.active_branch
-            tracking_branch = current_branch.tracking_branch()
-            
-            if tracking_branch:
-                # Check if we're ahead of the remote
-                commits_ahead = list(repo.iter_commits(f'{tracking_branch}..{current_branch}'))
-                if len(commits_ahead) > 0:
-                    return "DIRTY"  # Ahead of remote
-        except Exception:
-            # If we can't determine remote status, continue with tag checking
-            pass
-
-        # At this point, we know the repository is synced with remote (not DIRTY)
-        # Now check the relationship between HEAD and tags
-
-        # Get the commit hash of the current HEAD
         try:
             head_commit = repo.head.commit.hexsha
         except Exception:
-            return "CLEAN"  # Can't determine HEAD, assume clean
+            head_commit = None
 
-        # Get the latest tag
-        try:
-            # Get all tags sorted by creation date
-            tags = sorted(repo.tags, key=lambda t: t.commit.committed_date, reverse=True)
-            if not tags:
-                # No tags at all, assume UPDATED (commits exist but no tags)
-                return "UPDATED"
-            
-            latest_tag = tags[0]
-            latest_tag_commit = latest_tag.commit.hexsha
-        except Exception:
-            # No tags or error getting tags, assume UPDATED
-            return "UPDATED"
-
-        # Check if HEAD is newer than the latest tag
-        if head_commit != latest_tag_commit:
-            # Check if there are commits since the latest tag
-            try:
-                commits_since_tag = list(repo.iter_commits(f'{latest_tag}..HEAD'))
-                if len(commits_since_tag) > 0:
-                    return "UPDATED"  # HEAD is newer than latest tag
-                else:
-                    # This shouldn't happen (HEAD != tag but no commits between), but handle gracefully
-                    return "UPDATED"
-            except Exception:
-                return "UPDATED"
-
-        # At this point, HEAD matches the latest tag
-        # Check if this tag matches the current module version
-        version_tag = module_version  # Use semver format (x.y.z)
-        
-        if str(latest_tag) == version_tag:
-            return "CLEAN"  # Tag matches current version
-        else:
-            return "UNPUBLISHED"  # Tag exists but doesn't match current version
+        return _compute_git_status(repo, module_name, module_version, head_commit)
 
     except Exception as e:
         # If any error occurs, assume clean (don't want git issues to break the graph)
@@ -545,6 +567,120 @@ def check_git_status(
         return "CLEAN"
 
 
+def _tag_refs_fingerprint(git_dir: str) -> list:
+    """
+    Stat the files git rewrites when tags change.
+
+    Ref updates land via rename into .git/refs/tags (which bumps the
+    directory mtime) and `git pack-refs`/clones rewrite .git/packed-refs,
+    so together the two mtimes change whenever a tag is created, moved or
+    deleted.
+    """
+    fingerprint = []
+    for name in ("packed-refs", os.path.join("refs", "tags")):
+        try:
+            fingerprint.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+        except OSError:
+            fingerprint.append(None)
+    return fingerprint
+
+
+def _resolve_latest_tag(
+    repo: "git.Repo", module_name: str
+) -> Optional[Tuple[str, str]]:
+    """
+    Return (latest_tag_name, tagged_commit) for the newest tag, or None if
+    the repository has no tags.
+
+    One `git for-each-ref` call returns the newest tag together with its
+    (peeled) commit, instead of resolving every tag's commit through
+    GitPython just to sort them. The result is cached across runs keyed on
+    the tag refs fingerprint, so unchanged repositories skip the query.
+    """
+    fingerprint = _tag_refs_fingerprint(repo.git_dir)
+    cache = _get_git_tag_cache()
+    cached = cache.get(module_name)
+    if cached and cached[0] == fingerprint:
+        return tuple(cached[1]) if cached[1] else None
+
+    ref_info = repo.git.for_each_ref(
+        "refs/tags",
+        sort="-creatordate",
+        count=1,
+        format="%(refname:short)%00%(objectname)%00%(*objectname)",
+    )
+    if ref_info:
+        latest_tag, object_name, peeled_name = ref_info.split("\x00")
+        # Annotated tags need peeling to reach the tagged commit.
+        result = (latest_tag, peeled_name or object_name)
+    else:
+        result = None
+
+    global _git_tag_cache_dirty
+    cache[module_name] = [fingerprint, list(result) if result else None]
+    _git_tag_cache_dirty = True
+    return result
+
+
+def _compute_git_status(
+    repo: "git.Repo", module_name: str, module_version: str,
+    head_commit: Optional[str]
+) -> str:
+    """Compute a module's git status; see check_git_status for the states."""
+    # Check 1: Uncommitted changes (working directory dirty)
+    if repo.is_dirty(untracked_files=True):
+        return "DIRTY"  # Has uncommitted changes
+
+    # Check 2: Check if ahead of remote branch
+    try:
+        current_branch = repo.active_branch
+        tracking_branch = current_branch.tracking_branch()
+
+        if tracking_branch:
+            # Check if we're ahead of the remote. rev-list --count only
+            # returns the number; iter_commits would materialize a Commit
+            # object per commit just to take the length.
+            commits_ahead = int(
+                repo.git.rev_list("--count", f'{tracking_branch}..{current_branch}')
+            )
+            if commits_ahead > 0:
+                return "DIRTY"  # Ahead of remote
+    except Exception:
+        # If we can't determine remote status, continue with tag checking
+        pass
+
+    # At this point, we know the repository is synced with remote (not DIRTY)
+    # Now check the relationship between HEAD and tags
+
+    if head_commit is None:
+        return "CLEAN"  # Can't determine HEAD, assume clean
+
+    # Get the latest tag
+    try:
+        latest = _resolve_latest_tag(repo, module_name)
+        if latest is None:
+            # No tags at all, assume UPDATED (commits exist but no tags)
+            return "UPDATED"
+        latest_tag, latest_tag_commit = latest
+    except Exception:
+        # No tags or error getting tags, assume UPDATED
+        return "UPDATED"
+
+    # Check if HEAD is newer than the latest tag
+    if head_commit != latest_tag_commit:
+        # HEAD differs from the latest tag, so there are newer commits
+        return "UPDATED"
+
+    # At this point, HEAD matches the latest tag
+    # Check if this tag matches the current module version
+    version_tag = module_version  # Use semver format (x.y.z)
+
+    if latest_tag == version_tag:
+        return "CLEAN"  # Tag matches current version
+    else:
+        return "UNPUBLISHED"  # Tag exists but doesn't match current version
+
+
 def get_all_git_statuses(
     newest_versions: Dict[str, Version],
     untracked_modules: Dict[str, Version],
@@ -556,27 +692,34 @@ def get_all_git_statuses(
     Returns a dictionary mapping module names to their git status:
     'CLEAN', 'UPDATED', 'DIRTY', or 'UNPUBLISHED'.
     """
-    git_statuses = {}
-
     print("Checking git status for modules...")
 
-    # Check registry modules
-    for module_name, version in newest_versions.items():
-        status = check_git_status(module_name, str(version), base_dir)
-        git_statuses[module_name] = status
-        if status != "CLEAN":
-            print(f"  {module_name}: {status}")
-        else:
-            print(f"  {module_name}: clean")
-
-    # Check untracked modules
-    for module_name, version in untracked_modules.items():
-        status = check_git_status(module_name, str(version), base_dir)
-        git_statuses[module_name] = status
+    # Each check is dominated by git I/O, so run them all concurrently and
+    # report the results in the original order once they are collected.
+    checks = [
+        (module_name, version, False)
+        for module_name, version in newest_versions.items()
+    ] + [
+        (module_name, version, True)
+        for module_name, version in untracked_modules.items()
+    ]
+
+    with ThreadPoolExecutor() as executor:
+        statuses = executor.map(
+            lambda check: check_git_status(check[0], str(check[1]), base_dir), checks
+        )
+        git_statuses = {
+            module_name: status
+            for (module_name, _, _), status in zip(checks, statuses)
+        }
+
+    for module_name, _, is_untracked in checks:
+        status = git_statuses[module_name]
+        suffix = " (untracked)" if is_untracked else ""
         if status != "CLEAN":
-            print(f"  {module_name} (untracked): {status}")
+            print(f"  {module_name}{suffix}: {status}")
         else:
-            print(f"  {module_name} (untracked): clean")
+            print(f"  {module_name}{suffix}: clean")
 
     return git_statuses
 
@@ -588,9 +731,13 @@ def generate_dot_file(
     git_statuses: Dict[str, str],
     untracked_modules: Dict[str, Version],
     show_outdated: bool = False,
-) -> bool:
+) -> Tuple[bool, Optional[subprocess.Popen]]:
     """
-    Generate a DOT file for the dependency graph and create SVG output.
+    Generate a DOT file for the dependency graph and start SVG rendering.
+
+    Returns (success, svg_process). The SVG render runs in the background so
+    the caller can keep doing work; pass the process to finish_svg_render to
+    collect the result.
     """
     try:
         # Create the doc directory if it doesn't exist
@@ -600,134 +747,185 @@ def generate_dot_file(
         all_modules = dict(newest_versions)
         all_modules.update(untracked_modules)
 
+        # Check each module's dependency versions once up front; the result is
+        # shared by the redundancy pass and edge emission. The same pass also
+        # collects the modules with at least one outdated roo dependency (for
+        # red outlines when not showing outdated).
+        checked_dependencies = {}
+        modules_with_outdated = set()
+        for module, dependencies in all_dependencies.items():
+            checked_deps = check_dependency_versions(dependencies, all_modules)
+            checked_dependencies[module] = checked_deps
+            if not show_outdated and any(
+                not is_latest
+                for dep, is_latest in checked_deps
+                if dep.name in all_modules
+            ):
+                modules_with_outdated.add(module)
+
         # Find redundant dependencies to remove
         redundant_deps = find_redundant_dependencies(
-            all_dependencies, all_modules, keep_outdated=show_outdated
+            checked_dependencies, all_modules, keep_outdated=show_outdated
         )
-        
-        # Find modules with outdated dependencies (for red outline when not showing outdated)
-        modules_with_outdated = find_modules_with_outdated_deps(
-            all_dependencies, all_modules
-        ) if not show_outdated else set()
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("digraph dependencies {\n")
-            f.write("    rankdir=TB;\n")
-            f.write("    node [shape=box, style=filled];\n")
-            f.write("    edge [fontsize=10];\n\n")
-
-            # Write nodes (modules)
-            f.write("    // Modules\n")
-            for module_name in sorted(all_modules.keys()):
-                version = all_modules[module_name]
-                label = f"{module_name}\\n{version}"
-
-                # Choose node color based on git status and type
-                git_status = git_statuses.get(module_name, "CLEAN")
-                is_untracked = module_name in untracked_modules
-
-                if is_untracked:
-                    if git_status == "DIRTY":
-                        color = "plum"  # Pinkish-purple for dirty untracked modules
-                    elif git_status == "UPDATED":
-                        color = "khaki"  # Same as old dirty color for updated untracked
-                    elif git_status == "UNPUBLISHED":
-                        color = "lightblue"  # Blue-ish for unpublished untracked
-                    else:  # CLEAN
-                        color = "mistyrose"  # Light pink for clean untracked modules
-                else:
-                    if git_status == "DIRTY":
-                        color = "plum"  # Pink-ish for dirty registry modules  
-                    elif git_status == "UPDATED":
-                        color = "khaki"  # Same as old dirty color for updated modules
-                    elif git_status == "UNPUBLISHED":
-                        color = "lightblue"  # Blue-ish for unpublished modules
-                    else:  # CLEAN
-                        color = (
-                            "#b1dbab"  # Custom light green for clean registry modules
-                        )
 
-                # Determine outline color (red if module has outdated dependencies)
-                outline_color = "red" if module_name in modules_with_outdated else "black"
-                
-                f.write(
-                    f'    "{module_name}" [label="{label}", fillcolor="{color}", '
-                    f'color="{outline_color}"];\n'
-                )
+        # Accumulate the DOT text as a list of lines and write it in one go,
+        # rather than paying a buffered-IO call per node and edge.
+        lines = [
+            "digraph dependencies {",
+            "    rankdir=TB;",
+            "    node [shape=box, style=filled];",
+            "    edge [fontsize=10];",
+            "",
+            "    // Modules",
+        ]
+
+        # Sort the module names once; the node and edge passes below cover the
+        # same set of modules. Version strings are also rendered once here
+        # instead of per node/edge in the loops below.
+        sorted_module_names = sorted(all_modules.keys())
+        version_str = {name: str(version) for name, version in all_modules.items()}
+
+        for module_name in sorted_module_names:
+            label = f"{module_name}\\n{version_str[module_name]}"
+
+            # Choose node color based on git status and type
+            git_status = git_statuses.get(module_name, "CLEAN")
+            is_untracked = module_name in untracked_modules
+
+            if is_untracked:
+                if git_status == "DIRTY":
+                    color = "plum"  # Pinkish-purple for dirty untracked modules
+                elif git_status == "UPDATED":
+                    color = "khaki"  # Same as old dirty color for updated untracked
+                elif git_status == "UNPUBLISHED":
+                    color = "lightblue"  # Blue-ish for unpublished untracked
+                else:  # CLEAN
+                    color = "mistyrose"  # Light pink for clean untracked modules
+            else:
+                if git_status == "DIRTY":
+                    color = "plum"  # Pink-ish for dirty registry modules
+                elif git_status == "UPDATED":
+                    color = "khaki"  # Same as old dirty color for updated modules
+                elif git_status == "UNPUBLISHED":
+                    color = "lightblue"  # Blue-ish for unpublished modules
+                else:  # CLEAN
+                    color = (
+                        "#b1dbab"  # Custom light green for clean registry modules
+                    )
+
+            # Determine outline color (red if module has outdated dependencies)
+            outline_color = "red" if module_name in modules_with_outdated else "black"
+
+            lines.append(
+                f'    "{module_name}" [label="{label}", fillcolor="{color}", '
+                f'color="{outline_color}"];'
+            )
 
-            f.write("\n    // Dependencies\n")
+        lines.append("")
+        lines.append("    // Dependencies")
 
-            # Write edges (dependencies)
-            for module_name in sorted(all_dependencies.keys()):
-                dependencies = all_dependencies[module_name]
-                checked_deps = check_dependency_versions(dependencies, all_modules)
+        # Write edges (dependencies)
+        for module_name in sorted_module_names:
+            checked_deps = checked_dependencies.get(module_name, [])
 
-                for dep, is_latest in checked_deps:
-                    # Only include roo modules in the graph
-                    if dep.name not in all_modules:
-                        continue
+            for dep, is_latest in checked_deps:
+                # Only include roo modules in the graph
+                if dep.name not in all_modules:
+                    continue
 
-                    # Check if this dependency is redundant
-                    is_redundant = (module_name, dep.name) in redundant_deps
-
-                    if show_outdated:
-                        # Old behavior: Include edge if not redundant OR outdated
-                        if not is_redundant or not is_latest:
-                            if is_latest:
-                                # Up-to-date dependency
-                                f.write(f'    "{module_name}" -> "{dep.name}";\n')
-                            else:
-                                # Outdated dependency - use red color
-                                latest_version = all_modules[dep.name]
-                                label = f"{dep.version}\\n(latest: {latest_version})"
-                                f.write(
-                                    f'    "{module_name}" -> "{dep.name}" [color=red, fontcolor=red, label="{label}"];\n'
-                                )
-                    else:
-                        # New behavior: Only include if not redundant (regardless of version)
-                        if not is_redundant:
-                            if is_latest:
-                                # Up-to-date dependency
-                                f.write(f'    "{module_name}" -> "{dep.name}";\n')
-                            else:
-                                # Outdated dependency - use red color
-                                latest_version = all_modules[dep.name]
-                                label = f"{dep.version}\\n(latest: {latest_version})"
-                                f.write(
-                                    f'    "{module_name}" -> "{dep.name}" [color=red, fontcolor=red, label="{label}"];\n'
-                                )
-
-            f.write("}\n")
+                # Check if this dependency is redundant
+                is_redundant = (module_name, dep.name) in redundant_deps
+
+                # Old behavior (show_outdated): include edge if not redundant
+                # OR outdated. New behavior: only include if not redundant
+                # (regardless of version).
+                if is_redundant and not (show_outdated and not is_latest):
+                    continue
+
+                if is_latest:
+                    # Up-to-date dependency
+                    lines.append(f'    "{module_name}" -> "{dep.name}";')
+                else:
+                    # Outdated dependency - use red color
+                    label = f"{dep.version}\\n(latest: {version_str[dep.name]})"
+                    lines.append(
+                        f'    "{module_name}" -> "{dep.name}" [color=red, fontcolor=red, label="{label}"];'
+                    )
+
+        lines.append("}")
+        lines.append("")
+
+        dot_text = "\n".join(lines)
+
+        # If the DOT content is identical to the previous run, the Graphviz
+        # layout pass (which can take seconds on large graphs) can be skipped
+        # entirely as long as the SVG is already there.
+        try:
+            unchanged = output_path.read_text(encoding="utf-8") == dot_text
+        except OSError:
+            unchanged = False
+
+        if not unchanged:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(dot_text)
 
         # Generate SVG file using dot command
         svg_path = output_path.with_suffix(".svg")
+        if unchanged and svg_path.exists():
+            print(f"✓ SVG file is up to date (DOT unchanged): {svg_path}")
+            return True, None
+
+        # Kick the render off in the background; graph layout can take seconds
+        # on large graphs, and nothing downstream needs the SVG until the very
+        # end of the run.
         try:
-            result = subprocess.run(
+            svg_process = subprocess.Popen(
                 ["dot", "-Tsvg", str(output_path), "-o", str(svg_path)],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=30,
             )
-            if result.returncode == 0:
-                print(f"✓ Generated SVG file: {svg_path}")
-            else:
-                print(
-                    f"Warning: Failed to generate SVG file. dot command error: {result.stderr}"
-                )
         except FileNotFoundError:
             print(
                 f"Warning: 'dot' command not found. Please install Graphviz to generate SVG files."
             )
-        except subprocess.TimeoutExpired:
-            print(f"Warning: SVG generation timed out.")
+            svg_process = None
         except Exception as e:
             print(f"Warning: Failed to generate SVG file: {e}")
+            svg_process = None
 
-        return True
+        return True, svg_process
 
     except Exception as e:
         print(f"Error writing DOT file: {e}")
-        return False
+        return False, None
+
+
+def finish_svg_render(svg_process: Optional[subprocess.Popen], svg_path: Path) -> None:
+    """Wait for a background SVG render started by generate_dot_file."""
+    if svg_process is None:
+        return
+
+    try:
+        _, stderr = svg_process.communicate(timeout=30)
+        if svg_process.returncode == 0:
+            print(f"✓ Generated SVG file: {svg_path}")
+        else:
+            # dot -o leaves a partial file behind on failure; remove it so
+            # the unchanged-DOT check cannot skip the render forever based
+            # on a corrupt SVG.
+            svg_path.unlink(missing_ok=True)
+            print(
+                f"Warning: Failed to generate SVG file. dot command error: {stderr}"
+            )
+    except subprocess.TimeoutExpired:
+        svg_process.kill()
+        svg_process.wait()
+        svg_path.unlink(missing_ok=True)
+        print(f"Warning: SVG generation timed out.")
+    except Exception as e:
+        svg_path.unlink(missing_ok=True)
+        print(f"Warning: Failed to generate SVG file: {e}")
 
 
 def main():
@@ -783,18 +981,19 @@ and modules use normal black outlines.
         print("No modules found or no valid versions detected.")
         return False
 
-    # Find newest versions from registry
-    newest_versions = find_newest_versions(modules)
+    # Find newest versions from registry (get_modules_and_versions only
+    # records modules with at least one valid version)
+    newest_versions = {name: max(versions) for name, versions in modules.items()}
 
-    # Get untracked modules (roo_* directories outside registry, not in registry)
-    untracked_modules = get_untracked_modules(registry_dir, modules)
+    # Get untracked modules (roo_* directories outside registry, not in
+    # registry) together with their dependencies, in a single scan
+    untracked_modules, untracked_dependencies = scan_untracked_modules(
+        registry_dir, modules
+    )
 
     # Get dependencies for all newest versions (only from registry modules)
     all_dependencies = get_all_dependencies(modules_dir, newest_versions)
 
-    # Get dependencies for untracked modules
-    untracked_dependencies = get_untracked_dependencies(registry_dir, untracked_modules)
-
     # Combine all dependencies
     all_dependencies.update(untracked_dependencies)
 
@@ -803,22 +1002,26 @@ and modules use normal black outlines.
         newest_versions, untracked_modules, registry_dir.parent
     )
 
-    # Calculate counts
+    # Calculate counts (one pass over the statuses instead of four)
     total_modules = len(newest_versions) + len(untracked_modules)
-    clean_count = sum(1 for status in git_statuses.values() if status == "CLEAN")
-    updated_count = sum(1 for status in git_statuses.values() if status == "UPDATED")
-    dirty_count = sum(1 for status in git_statuses.values() if status == "DIRTY")
-    unpublished_count = sum(1 for status in git_statuses.values() if status == "UNPUBLISHED")
+    status_counts = Counter(git_statuses.values())
+    clean_count = status_counts["CLEAN"]
+    updated_count = status_counts["UPDATED"]
+    dirty_count = status_counts["DIRTY"]
+    unpublished_count = status_counts["UNPUBLISHED"]
+
+    # Every known roo module, for the per-module dependency counts below; one
+    # set probe per dependency instead of two dict probes.
+    known_modules = set(newest_versions)
+    known_modules.update(untracked_modules)
 
     print(f"\nFound {len(newest_versions)} registry modules:")
     for module_name in sorted(newest_versions.keys()):
         version = newest_versions[module_name]
-        dep_count = len(
-            [
-                dep
-                for dep in all_dependencies.get(module_name, [])
-                if dep.name in newest_versions or dep.name in untracked_modules
-            ]
+        dep_count = sum(
+            1
+            for dep in all_dependencies.get(module_name, ())
+            if dep.name in known_modules
         )
         git_status = git_statuses.get(module_name, "CLEAN")
         status = git_status.lower() if git_status != "CLEAN" else "clean"
@@ -836,22 +1039,19 @@ and modules use normal black outlines.
         f"\nSummary: {clean_count} clean, {updated_count} updated, {unpublished_count} unpublished, {dirty_count} dirty modules"
     )
 
-    # Generate DOT file
-    if generate_dot_file(
+    # Generate DOT file; the SVG render continues in the background while the
+    # summary below is printed.
+    success, svg_process = generate_dot_file(
         output_path,
         newest_versions,
         all_dependencies,
         git_statuses,
         untracked_modules,
         show_outdated=args.show_outdated,
-    ):
+    )
+    if success:
         print(f"\n✓ Successfully generated dependency graph: {output_path}")
 
-        # Check if SVG was generated
-        svg_path = output_path.with_suffix(".svg")
-        if svg_path.exists():
-            print(f"✓ Also generated SVG visualization: {svg_path}")
-
         print(f"\nNode colors:")
         print(
             f"  Light green (#b1dbab): Clean registry modules (git status matches latest tag)"
@@ -869,6 +1069,13 @@ and modules use normal black outlines.
         if not args.show_outdated:
             print(f"  Red outline: Modules with outdated dependencies")
         print(f"  Red edges: Outdated dependencies")
+
+        # Collect the background SVG render last.
+        svg_path = output_path.with_suffix(".svg")
+        finish_svg_render(svg_process, svg_path)
+        if svg_path.exists():
+            print(f"✓ Also generated SVG visualization: {svg_path}")
+
         return True
     else:
         print(f"\n✗ Failed to generate dependency graph")
@@ -3,8 +3,12 @@
 Shared utilities for working with roo modules and their dependencies.
 """
 
+import functools
 import os
 import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict, Set, Optional
 from pathlib import Path
 
@@ -18,14 +22,36 @@ except ImportError:
     )
 
 
+# git.Repo construction re-parses the repository config and refs; the helpers
+# below are routinely called several times for the same repository in one
+# run, so share one handle per path. Entries are dropped when an operation on
+# them fails, forcing a fresh handle on the next call.
+_REPO_CACHE: Dict[str, "git.Repo"] = {}
+
+
+def _repo(repo_path: Path) -> "git.Repo":
+    """Return a cached git.Repo for the given path, creating it on demand."""
+    key = os.fspath(repo_path)
+    repo = _REPO_CACHE.get(key)
+    if repo is None:
+        repo = git.Repo(repo_path)
+        _REPO_CACHE[key] = repo
+    return repo
+
+
+def _drop_repo(repo_path: Path) -> None:
+    """Evict a cached git.Repo after a failed operation."""
+    _REPO_CACHE.pop(os.fspath(repo_path), None)
+
+
 def get_git_status(repo_path: Path) -> Tuple[bool, List[str]]:
     """
     Check if repository has uncommitted changes.
     Returns (has_changes, list_of_changes).
     """
     try:
-        repo = git.Repo(repo_path)
-        
+        repo = _repo(repo_path)
+
         # Check for dirty files (modified, staged, untracked)
         changes = []
         
@@ -43,6 +69,7 @@ def get_git_status(repo_path: Path) -> Tuple[bool, List[str]]:
         
         return len(changes) > 0, changes
     except Exception as e:
+        _drop_repo(repo_path)
         return False, [f"Error checking git status: {str(e)}"]
 
 
@@ -52,11 +79,12 @@ def get_current_branch(repo_path: Path) -> Tuple[bool, str]:
     Returns (success, branch_name_or_error_msg).
     """
     try:
-        repo = git.Repo(repo_path)
+        repo = _repo(repo_path)
         if repo.head.is_detached:
             return False, "Not on any branch (detached HEAD)"
         return True, repo.active_branch.name
     except Exception as e:
+        _drop_repo(repo_path)
         return False, f"Could not determine current branch: {str(e)}"
 
 
@@ -66,7 +94,7 @@ def get_upstream_branch(repo_path: Path, branch: str) -> Tuple[bool, str]:
     Returns (success, upstream_branch_or_error_msg).
     """
     try:
-        repo = git.Repo(repo_path)
+        repo = _repo(repo_path)
         branch_obj = repo.heads[branch]
         
         if branch_obj.tracking_branch() is None:
@@ -75,6 +103,7 @@ def get_upstream_branch(repo_path: Path, branch: str) -> Tuple[bool, str]:
         upstream = branch_obj.tracking_branch().name
         return True, upstream
     except Exception as e:
+        _drop_repo(repo_path)
         return False, f"Could not get upstream branch: {str(e)}"
 
 
@@ -84,13 +113,21 @@ def count_commits_between(repo_path: Path, base: str, head: str) -> Tuple[bool,
     Returns (success, commit_count, error_msg_if_failed).
     """
     try:
-        repo = git.Repo(repo_path)
-        commits = list(repo.iter_commits(f"{base}..{head}"))
-        return True, len(commits), ""
+        repo = _repo(repo_path)
+        # rev-list --count returns just the number; iter_commits would
+        # materialize a Commit object per commit only to be counted.
+        count = int(repo.git.rev_list("--count", f"{base}..{head}"))
+        return True, count, ""
     except Exception as e:
+        _drop_repo(repo_path)
         return False, 0, str(e)
 
 
+# Matches the "ahead N" part of for-each-ref's %(upstream:track), e.g.
+# "[ahead 2]" or "[ahead 2, behind 1]".
+_TRACK_AHEAD_PATTERN = re.compile(r'ahead (\d+)')
+
+
 def has_unpushed_commits(repo_path: Path) -> Tuple[bool, str]:
     """
     Check if repository has unpushed commits.
@@ -100,32 +137,134 @@ def has_unpushed_commits(repo_path: Path) -> Tuple[bool, str]:
     success, branch = get_current_branch(repo_path)
     if not success:
         return False, branch  # branch contains error message
-    
-    # Get upstream branch
-    success, upstream = get_upstream_branch(repo_path, branch)
-    if not success:
-        return False, upstream  # upstream contains error message
-    
-    # Count unpushed commits
-    success, count, error = count_commits_between(repo_path, upstream, branch)
-    if not success:
-        return False, f"Could not check unpushed commits: {error}"
-    
+
+    try:
+        repo = _repo(repo_path)
+        # One for-each-ref call returns the upstream together with the
+        # ahead/behind summary, replacing a separate upstream lookup and a
+        # rev-list invocation.
+        ref_info = repo.git.for_each_ref(
+            f"refs/heads/{branch}",
+            format="%(upstream:short)%00%(upstream:track)",
+        )
+        upstream, _, track = ref_info.partition("\x00")
+        if not upstream:
+            return False, f"No upstream branch configured for {branch}"
+
+        ahead_match = _TRACK_AHEAD_PATTERN.search(track)
+        count = int(ahead_match.group(1)) if ahead_match else 0
+    except Exception as e:
+        _drop_repo(repo_path)
+        return False, f"Could not check unpushed commits: {str(e)}"
+
     return count > 0, f"{count} unpushed commits on {branch}"
 
 
-def has_remote_changes(repo_path: Path) -> Tuple[bool, str]:
+# Matches the "# branch.ab +<ahead> -<behind>" header of porcelain v2 output.
+_BRANCH_AB_PATTERN = re.compile(r'\+(\d+) -(\d+)')
+
+
+def get_repo_state(repo_path: Path) -> Tuple[bool, Dict[str, object]]:
+    """
+    Collect branch, upstream, ahead/behind counts and dirty files with one
+    git call.
+
+    `git status --porcelain=v2 --branch` reports all of these in a single
+    invocation, replacing the separate branch/upstream/rev-list/status
+    queries that would otherwise each spawn their own git process.
+
+    Returns (success, state). On success, state maps:
+        branch:   current branch name, or None in detached HEAD state
+        upstream: upstream ref name, or None if not configured
+        ahead:    commits ahead of upstream (0 when no upstream)
+        behind:   commits behind upstream (0 when no upstream)
+        changes:  list of change descriptions, as in get_git_status
+    On failure, state is {"error": message}.
+    """
+    try:
+        repo = _repo(repo_path)
+        output = repo.git.status('--porcelain=v2', '--branch')
+    except Exception as e:
+        _drop_repo(repo_path)
+        return False, {"error": f"Could not check repository state: {str(e)}"}
+
+    branch = None
+    upstream = None
+    ahead = 0
+    behind = 0
+    changes = []
+
+    for line in output.splitlines():
+        if line.startswith('# branch.head '):
+            head = line[len('# branch.head '):]
+            if head != '(detached)':
+                branch = head
+        elif line.startswith('# branch.upstream '):
+            upstream = line[len('# branch.upstream '):]
+        elif line.startswith('# branch.ab '):
+            match = _BRANCH_AB_PATTERN.search(line)
+            if match:
+                ahead = int(match.group(1))
+                behind = int(match.group(2))
+        elif line.startswith('? '):
+            changes.append(f"?? {line[2:]}")
+        elif line.startswith(('1 ', '2 ', 'u ')):
+            # "<type> <XY> ..." entries for changed/renamed/unmerged paths;
+            # the path is the last whitespace-separated field.
+            fields = line.split(' ')
+            changes.append(f"{fields[1]} {fields[-1]}")
+
+    return True, {
+        "branch": branch,
+        "upstream": upstream,
+        "ahead": ahead,
+        "behind": behind,
+        "changes": changes,
+    }
+
+
+def fetch_all(repo_paths: List[Path], max_workers: int = 16) -> Dict[Path, str]:
+    """
+    Fetch from origin for several repositories concurrently.
+
+    Each fetch is dominated by network round-trips, so running them on a
+    thread pool brings the wall time down to roughly the slowest fetch.
+    Callers that prefetch this way can pass fetch=False to
+    has_remote_changes to avoid fetching the same remotes again.
+
+    Returns a dict mapping the paths whose fetch failed to an error message.
+    """
+    def fetch_one(repo_path: Path):
+        try:
+            _repo(repo_path).remotes.origin.fetch()
+            return None
+        except Exception as e:
+            _drop_repo(repo_path)
+            return f"Could not fetch from remote: {str(e)}"
+
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for repo_path, error in zip(repo_paths, executor.map(fetch_one, repo_paths)):
+            if error is not None:
+                errors[repo_path] = error
+
+    return errors
+
+
+def has_remote_changes(repo_path: Path, fetch: bool = True) -> Tuple[bool, str]:
     """
     Check if there are remote changes to pull.
+
+    Pass fetch=False when the remote refs are already fresh (e.g. after
+    fetch_all) to skip the per-call network round-trip.
+
     Returns (has_remote_changes, info_message).
     """
     try:
-        repo = git.Repo(repo_path)
-        origin = repo.remotes.origin
-        
-        # Fetch to get latest remote info
-        origin.fetch()
-        
+        if fetch:
+            # Fetch to get latest remote info
+            _repo(repo_path).remotes.origin.fetch()
+
         # Get current branch
         success, branch = get_current_branch(repo_path)
         if not success:
@@ -143,18 +282,49 @@ def has_remote_changes(repo_path: Path) -> Tuple[bool, str]:
         
         return count > 0, f"{count} remote changes available" if count > 0 else "No remote changes"
     except Exception as e:
+        _drop_repo(repo_path)
         return False, f"Could not fetch from remote: {str(e)}"
 
 
+# Stderr markers of transient network failures that are worth retrying.
+# Anything else (auth errors, non-fast-forward, dirty tree) fails fast.
+_TRANSIENT_GIT_ERROR_PATTERN = re.compile(
+    r'Could not resolve host|Connection timed out|Connection reset|'
+    r'Operation timed out|early EOF|unexpected disconnect|'
+    r'remote end hung up',
+    re.IGNORECASE,
+)
+
+_RETRY_DELAYS = (1, 4, 16)
+
+
+def _retry_transient(operation):
+    """
+    Run a git network operation, retrying transient failures.
+
+    Retries with 1s/4s/16s backoff when the error message matches a known
+    transient network marker; any other failure propagates immediately so
+    real errors are reported on the first attempt.
+    """
+    for delay in _RETRY_DELAYS:
+        try:
+            return operation()
+        except Exception as e:
+            if not _TRANSIENT_GIT_ERROR_PATTERN.search(str(e)):
+                raise
+            time.sleep(delay)
+    return operation()
+
+
 def git_push(repo_path: Path) -> Tuple[bool, str]:
     """Push commits to remote. Returns (success, message)."""
     try:
-        repo = git.Repo(repo_path)
+        repo = _repo(repo_path)
         origin = repo.remotes.origin
         current_branch = repo.active_branch.name
         
         # Push current branch to origin
-        push_infos = origin.push(current_branch)
+        push_infos = _retry_transient(lambda: origin.push(current_branch))
         
         # Check for errors in push results
         for push_info in push_infos:
@@ -163,56 +333,75 @@ def git_push(repo_path: Path) -> Tuple[bool, str]:
         
         return True, "Successfully pushed"
     except Exception as e:
+        _drop_repo(repo_path)
         return False, f"Push failed: {str(e)}"
 
 
 def git_pull_rebase(repo_path: Path) -> Tuple[bool, str]:
     """Pull with rebase from remote. Returns (success, message)."""
     try:
-        repo = git.Repo(repo_path)
+        repo = _repo(repo_path)
         
         # Pull with rebase (equivalent to 'git pull --rebase')
-        repo.git.pull('--rebase')
+        _retry_transient(lambda: repo.git.pull('--rebase'))
         return True, "Successfully pulled with rebase"
     except Exception as e:
+        _drop_repo(repo_path)
         return False, f"Pull rebase failed: {str(e)}"
 
 
 def git_clone(repo_url: str, target_path: Path, timeout: int = 60) -> Tuple[bool, str]:
     """Clone a repository from GitHub. Returns (success, message)."""
     try:
-        git.Repo.clone_from(repo_url, str(target_path))
+        _retry_transient(lambda: git.Repo.clone_from(repo_url, str(target_path)))
         return True, "Successfully cloned"
     except Exception as e:
         return False, f"Clone failed: {str(e)}"
 
 
+_VERSION_PATTERN = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-(.+))?$')
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_version(version_str: str) -> Tuple[int, int, int, Optional[str]]:
+    """
+    Parse a semantic version string into (major, minor, patch, prerelease).
+    The same version strings recur across many modules and directory names,
+    so the parse is memoized.
+    """
+    match = _VERSION_PATTERN.match(version_str)
+    if not match:
+        raise ValueError(f"Invalid version format: {version_str}")
+
+    major, minor, patch, prerelease = match.groups()
+    return int(major), int(minor), int(patch), prerelease
+
+
 class Version:
     """Class to represent and compare semantic versions."""
-    
+
+    # One instance per directory name and per dependency edge; __slots__
+    # drops the per-instance __dict__ and speeds up attribute access.
+    __slots__ = ('original', 'major', 'minor', 'patch', 'prerelease', '_key')
+
     def __init__(self, version_str: str):
         self.original = version_str
         # Parse semantic version (major.minor.patch)
-        match = re.match(r'^(\d+)\.(\d+)\.(\d+)(?:-(.+))?$', version_str)
-        if not match:
-            raise ValueError(f"Invalid version format: {version_str}")
-        
-        self.major = int(match.group(1))
-        self.minor = int(match.group(2))
-        self.patch = int(match.group(3))
-        self.prerelease = match.group(4) if match.group(4) else None
-    
+        self.major, self.minor, self.patch, self.prerelease = _parse_version(
+            version_str
+        )
+        # Precomputed comparison key: versions are compared all over the
+        # outdated/redundancy checks, and tuple comparison runs in C.
+        self._key = (self.major, self.minor, self.patch)
+
     def __lt__(self, other):
         if not isinstance(other, Version):
             return NotImplemented
-        
+
         # Compare major, minor, patch
-        self_tuple = (self.major, self.minor, self.patch)
-        other_tuple = (other.major, other.minor, other.patch)
-        
-        if self_tuple != other_tuple:
-            return self_tuple < other_tuple
-        
+        if self._key != other._key:
+            return self._key < other._key
+
         # If versions are equal, prerelease versions are less than normal versions
         if self.prerelease is None and other.prerelease is not None:
             return False
@@ -220,15 +409,19 @@ class Version:
             return True
         if self.prerelease is not None and other.prerelease is not None:
             return self.prerelease < other.prerelease
-        
+
         return False
-    
+
     def __eq__(self, other):
         if not isinstance(other, Version):
             return NotImplemented
-        return (self.major, self.minor, self.patch, self.prerelease) == \
-               (other.major, other.minor, other.patch, other.prerelease)
-    
+        return self._key == other._key and self.prerelease == other.prerelease
+
+    def __hash__(self):
+        # Consistent with __eq__, which ignores `original` formatting;
+        # hashability lets versions serve as set members and dict keys.
+        return hash((self._key, self.prerelease))
+
     def __str__(self):
         return self.original
     
@@ -238,9 +431,14 @@ class Version:
 
 class Dependency:
     """Class to represent a module dependency."""
-    
+
+    __slots__ = ('name', 'version')
+
     def __init__(self, name: str, version: str):
-        self.name = name
+        # The same module names recur across many MODULE.bazel files;
+        # interning shares the storage and gives membership tests an
+        # identity fast path.
+        self.name = sys.intern(name)
         self.version = Version(version)
     
     def __str__(self):
@@ -250,53 +448,81 @@ class Dependency:
         return f"Dependency('{self.name}', '{self.version}')"
 
 
+# Compiled once at import; parse_module_bazel runs over many files per
+# invocation. The module(...) and bazel_dep(...) declarations share their
+# argument shape, so one alternation scans the file in a single pass and the
+# kind group tells the matches apart:
+#   module(name = "module_name", version = "x.y.z")
+#   bazel_dep(name = "dependency_name", version = "x.y.z")
+# Dependencies to ignore (external/third-party dependencies)
+_IGNORED_DEPS = frozenset({"googletest", "rules_proto", "glog"})
+
+_MODULE_OR_DEP_PATTERN = re.compile(
+    r'(?P<kind>module|bazel_dep)'
+    r'\s*\(\s*name\s*=\s*["\']([^"\']+)["\']\s*,\s*version\s*=\s*["\']([^"\']+)["\']\s*\)'
+)
+
+
 def parse_module_bazel(module_bazel_path: Path) -> Tuple[str, str, List[Dependency]]:
     """
     Parse a MODULE.bazel file and extract module info and dependencies.
-    
+
+    Results are memoized per (path, mtime, size), so each file is read and
+    parsed at most once per run even when several passes ask for it.
+
     Returns:
         Tuple of (module_name, module_version, dependencies_list)
     """
+    try:
+        stat = os.stat(module_bazel_path)
+    except OSError:
+        return None, None, []
+
+    module_name, module_version, dependencies = _parse_module_bazel_cached(
+        os.fspath(module_bazel_path), stat.st_mtime_ns, stat.st_size
+    )
+    # Hand out a fresh list so callers can't mutate the cached entry.
+    return module_name, module_version, list(dependencies)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_module_bazel_cached(
+    module_bazel_path: str, mtime_ns: int, size: int
+) -> Tuple[str, str, List[Dependency]]:
+    """Uncached MODULE.bazel parse; see parse_module_bazel."""
     dependencies = []
     module_name = None
     module_version = None
-    
-    # Dependencies to ignore (external/third-party dependencies)
-    ignored_deps = {"googletest", "rules_proto", "glog"}
-    
-    if not module_bazel_path.exists():
-        return module_name, module_version, dependencies
-    
+
     try:
-        with open(module_bazel_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract module declaration
-        # Pattern: module(name = "module_name", version = "x.y.z")
-        module_pattern = r'module\s*\(\s*name\s*=\s*["\']([^"\']+)["\']\s*,\s*version\s*=\s*["\']([^"\']+)["\']\s*\)'
-        module_match = re.search(module_pattern, content)
-        if module_match:
-            module_name = module_match.group(1)
-            module_version = module_match.group(2)
-        
-        # Find all bazel_dep declarations
-        # Pattern: bazel_dep(name = "dependency_name", version = "x.y.z")
-        dep_pattern = r'bazel_dep\s*\(\s*name\s*=\s*["\']([^"\']+)["\']\s*,\s*version\s*=\s*["\']([^"\']+)["\']\s*\)'
-        
-        for match in re.finditer(dep_pattern, content):
-            dep_name = match.group(1)
-            dep_version = match.group(2)
-            
+        # Read the raw bytes and decode once, rather than paying text-mode's
+        # incremental decoding; the stat in parse_module_bazel already
+        # established that the file exists.
+        with open(module_bazel_path, 'rb') as f:
+            content = f.read().decode('utf-8')
+
+        # Extract the module declaration and all bazel_dep declarations in a
+        # single scan of the content
+        for match in _MODULE_OR_DEP_PATTERN.finditer(content):
+            if match.group('kind') == 'module':
+                if module_name is None:
+                    module_name = sys.intern(match.group(2))
+                    module_version = match.group(3)
+                continue
+
+            dep_name = match.group(2)
+            dep_version = match.group(3)
+
             # Skip ignored dependencies
-            if dep_name in ignored_deps:
+            if dep_name in _IGNORED_DEPS:
                 continue
-            
+
             try:
                 dependency = Dependency(dep_name, dep_version)
                 dependencies.append(dependency)
             except ValueError as e:
                 print(f"Warning: Invalid dependency version '{dep_version}' for '{dep_name}' in {module_bazel_path}: {e}")
-        
+
     except Exception as e:
         print(f"Error reading {module_bazel_path}: {e}")
     
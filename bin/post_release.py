@@ -15,10 +15,15 @@ This script will:
 Example: python3 roo-registry/bin/post_release.py roo_display
 """
 
+import functools
+import os
+import shutil
+import stat
 import sys
 import subprocess
 import argparse
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -53,27 +58,49 @@ def run_command(cmd: list, cwd: Optional[Path] = None, check: bool = True, show_
     return result
 
 
+def confirm(prompt: str, assume_yes: bool = False) -> bool:
+    """
+    Ask the user for a yes/no confirmation.
+
+    Returns True without prompting when assume_yes is set (--yes flag) or
+    when stdin is not a TTY, so automated runs never block on input().
+    """
+    if assume_yes or not sys.stdin.isatty():
+        return True
+    response = input(prompt)
+    return response.lower() == 'y'
+
+
 def clean_and_pull_module(module_dir: Path) -> bool:
     """
     Clean bazel artifacts and pull latest changes in module directory.
     """
     print(f"\nCleaning and updating {module_dir.name}...")
-    
-    # Run bazel clean
-    print("  Running bazel clean...")
-    result = run_command(
-        ["bazel", "clean"],
-        cwd=module_dir,
-        check=False
+
+    # A previous build leaves bazel-bin/bazel-out convenience symlinks in
+    # the workspace; without them there is nothing to clean and no reason
+    # to spin up a bazel server.
+    clean_proc = None
+    has_bazel_output = any(
+        os.path.lexists(os.path.join(module_dir, name))
+        for name in ("bazel-bin", "bazel-out")
     )
-    
-    if result.returncode != 0:
-        print(f"  Warning: bazel clean failed (module may not use bazel)")
+    if has_bazel_output:
+        # Start bazel clean in the background; it is disk-bound while the
+        # git pull below is network-bound, so the two overlap well.
+        print("  Running bazel clean...")
+        clean_proc = subprocess.Popen(
+            ["bazel", "clean"],
+            cwd=module_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
     else:
-        print("  ✓ Bazel clean completed")
-    
-    # Run git pull
+        print("  No bazel output in workspace, skipping bazel clean")
+
+    # Run git pull while the clean proceeds
     print("  Running git pull...")
+    pull_ok = True
     try:
         repo = git.Repo(module_dir)
         origin = repo.remotes.origin
@@ -82,9 +109,18 @@ def clean_and_pull_module(module_dir: Path) -> bool:
         print("    Git pull successful")
     except Exception as e:
         print(f"  Warning: Git pull failed: {str(e)}")
+        pull_ok = False
+
+    if clean_proc is not None:
+        if clean_proc.wait() != 0:
+            print(f"  Warning: bazel clean failed (module may not use bazel)")
+        else:
+            print("  ✓ Bazel clean completed")
+
+    if not pull_ok:
         return False
     print("  ✓ Git pull completed")
-    
+
     return True
 
 
@@ -158,7 +194,7 @@ def generate_dependency_graph(registry_dir: Path) -> bool:
     return True
 
 
-def amend_commit_with_graph(registry_dir: Path) -> bool:
+def amend_commit_with_graph(registry_dir: Path, repo: "git.Repo") -> bool:
     """
     Amend the last commit to include the updated dependency graph files.
     """
@@ -170,15 +206,21 @@ def amend_commit_with_graph(registry_dir: Path) -> bool:
     
     staged_files = []
     try:
-        repo = git.Repo(registry_dir)
+        existing_paths = []
         for file in graph_files:
             file_path = doc_dir / file
             if file_path.exists():
-                repo.index.add([str(file_path)])
+                existing_paths.append(str(file_path))
                 staged_files.append(file)
-                print(f"  Staged: {file}")
             else:
                 print(f"  Warning: {file} not found in {doc_dir}")
+
+        if staged_files:
+            # Stage everything with one index write instead of reacquiring
+            # the index lock per file
+            repo.index.add(existing_paths)
+            for file in staged_files:
+                print(f"  Staged: {file}")
     except Exception as e:
         print(f"  Error staging files: {str(e)}")
         return False
@@ -189,7 +231,6 @@ def amend_commit_with_graph(registry_dir: Path) -> bool:
     
     # Amend the last commit
     try:
-        repo = git.Repo(registry_dir)
         repo.git.commit('--amend', '--no-edit')
         print("  Amended commit with dependency graph updates")
     except Exception as e:
@@ -200,18 +241,23 @@ def amend_commit_with_graph(registry_dir: Path) -> bool:
     return True
 
 
-def push_registry_changes(registry_dir: Path) -> bool:
+def push_registry_changes(repo: "git.Repo") -> bool:
     """
     Push the registry changes to remote.
     """
     print(f"\nPushing registry changes...")
     
-    # Need to force push since we amended the commit
+    # Need to force push since we amended the commit. The lease value is
+    # made explicit: the remote must still be at our remote-tracking ref,
+    # which git can verify without an extra round trip. (The pre-amend
+    # local HEAD is not a valid lease: that commit was never pushed.)
     try:
-        repo = git.Repo(registry_dir)
-        origin = repo.remotes.origin
         current_branch = repo.active_branch.name
-        repo.git.push('--force-with-lease', 'origin', current_branch)
+        expected_sha = repo.commit(f'origin/{current_branch}').hexsha
+        repo.git.push(
+            f'--force-with-lease=refs/heads/{current_branch}:{expected_sha}',
+            'origin', current_branch
+        )
         print("  Registry changes pushed successfully")
     except Exception as e:
         print(f"  Error: Failed to push: {str(e)}")
@@ -221,36 +267,25 @@ def push_registry_changes(registry_dir: Path) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=1)
 def find_pio_executable() -> Optional[str]:
     """
     Find the PlatformIO executable.
-    Tries multiple methods to locate it.
+
+    The result only depends on PATH and HOME, so it is memoized; the lookup
+    itself uses shutil.which rather than forking a `which` subprocess.
     """
     # Method 1: Check if pio is in PATH
-    result = subprocess.run(
-        ["which", "pio"],
-        capture_output=True,
-        text=True
-    )
-    if result.returncode == 0 and result.stdout.strip():
-        return result.stdout.strip()
-    
+    pio_path = shutil.which("pio")
+    if pio_path:
+        return pio_path
+
     # Method 2: Check common installation location
     home = Path.home()
     common_path = home / ".platformio" / "penv" / "bin" / "pio"
     if common_path.exists():
         return str(common_path)
-    
-    # Method 3: Try to find using command -v
-    result = subprocess.run(
-        ["command", "-v", "pio"],
-        shell=True,
-        capture_output=True,
-        text=True
-    )
-    if result.returncode == 0 and result.stdout.strip():
-        return result.stdout.strip()
-    
+
     return None
 
 
@@ -288,7 +323,7 @@ def publish_to_platformio(module_dir: Path) -> bool:
     return True
 
 
-def post_release(module_name: str, skip_publish: bool = False) -> bool:
+def post_release(module_name: str, skip_publish: bool = False, assume_yes: bool = False) -> bool:
     """
     Finalize the release of a module.
     
@@ -304,8 +339,13 @@ def post_release(module_name: str, skip_publish: bool = False) -> bool:
     print(f"Module directory: {module_dir}")
     print(f"Registry directory: {registry_dir}")
     
-    # Validate module directory
-    if not module_dir.exists() or not module_dir.is_dir():
+    # Validate module directory with one stat call (exists + is_dir each
+    # stat separately)
+    try:
+        if not stat.S_ISDIR(os.stat(module_dir).st_mode):
+            print(f"Error: Module directory does not exist: {module_dir}")
+            return False
+    except OSError:
         print(f"Error: Module directory does not exist: {module_dir}")
         return False
     
@@ -329,24 +369,37 @@ def post_release(module_name: str, skip_publish: bool = False) -> bool:
     if not generate_dependency_graph(registry_dir):
         return False
     
+    # One Repo handle for the registry; constructing it re-parses config
+    # and refs, so share it between the amend and push steps.
+    registry_repo = git.Repo(registry_dir)
+
     # Step 5: Amend commit to include dependency graph
-    if not amend_commit_with_graph(registry_dir):
-        return False
-    
-    # Step 6: Push registry changes
-    if not push_registry_changes(registry_dir):
+    if not amend_commit_with_graph(registry_dir, registry_repo):
         return False
     
-    # Step 7: Publish to PlatformIO (unless skipped)
-    if not skip_publish:
-        if not publish_to_platformio(module_dir):
+    # Steps 6 and 7: push registry changes and publish to PlatformIO.
+    # The push talks to the registry remote and the publish talks to the
+    # PlatformIO registry from the module directory, so when both are
+    # needed they run concurrently.
+    if skip_publish:
+        if not push_registry_changes(registry_repo):
+            return False
+        print("\nSkipping PlatformIO publish (--skip-publish flag)")
+    else:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            push_future = executor.submit(push_registry_changes, registry_repo)
+            publish_future = executor.submit(publish_to_platformio, module_dir)
+            push_ok = push_future.result()
+            publish_ok = publish_future.result()
+
+        if not push_ok:
+            return False
+
+        if not publish_ok:
             print("\nWarning: PlatformIO publish failed.")
-            response = input("Continue anyway? [y/N] ")
-            if response.lower() != 'y':
+            if not confirm("Continue anyway? [y/N] ", assume_yes):
                 print("Aborted.")
                 return False
-    else:
-        print("\nSkipping PlatformIO publish (--skip-publish flag)")
     
     print(f"\n✓ Successfully finalized release for {module_name} version {version}")
     return True
@@ -380,10 +433,16 @@ Example: python3 roo-registry/bin/post_release.py roo_display
         action="store_true",
         help="Skip publishing to PlatformIO"
     )
-    
+
+    parser.add_argument(
+        "--yes", "-y",
+        action="store_true",
+        help="Answer yes to all confirmation prompts"
+    )
+
     args = parser.parse_args()
-    
-    success = post_release(args.module_name, args.skip_publish)
+
+    success = post_release(args.module_name, args.skip_publish, args.yes)
     
     sys.exit(0 if success else 1)
 
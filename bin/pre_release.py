@@ -16,6 +16,7 @@ Example: python3 roo-registry/bin/pre_release.py roo_display --patch
 
 import sys
 import os
+import stat
 import subprocess
 import argparse
 import re
@@ -35,11 +36,34 @@ except ImportError:
 sys.path.insert(0, str(Path(__file__).parent))
 from module_utils import (
     Version, parse_module_bazel, get_git_status,
-    has_remote_changes, count_commits_between, get_current_branch, 
+    has_remote_changes, get_current_branch,
     get_upstream_branch, git_push
 )
 
 
+def confirm(prompt: str, assume_yes: bool = False) -> bool:
+    """
+    Ask the user for a yes/no confirmation.
+
+    Returns True without prompting when assume_yes is set (--yes flag) or
+    when stdin is not a TTY, so automated runs never block on input().
+    """
+    if assume_yes or not sys.stdin.isatty():
+        return True
+    response = input(prompt)
+    return response.lower() == 'y'
+
+
+# Compiled once at import; these match the module(name = ..., version = ...)
+# declaration in MODULE.bazel.
+_MODULE_VERSION_PATTERN = re.compile(
+    r'module\s*\(\s*name\s*=\s*"[^"]+"\s*,\s*version\s*=\s*"([^"]+)"\s*\)'
+)
+_MODULE_VERSION_SUB_PATTERN = re.compile(
+    r'(module\s*\(\s*name\s*=\s*"[^"]+"\s*,\s*version\s*=\s*")[^"]+(")'
+)
+
+
 def run_command(cmd: list, cwd: Optional[Path] = None, check: bool = True) -> subprocess.CompletedProcess:
     """Run a command and return the result."""
     result = subprocess.run(
@@ -97,28 +121,32 @@ def check_git_status(module_dir: Path) -> bool:
         print("Warning: No upstream branch configured, skipping upstream checks")
         return True
     
-    # Check if local is behind remote
-    success, behind_count, error = count_commits_between(module_dir, branch, upstream_branch)
-    if not success:
-        print(f"Error: Could not check if behind remote: {error}")
+    # Check ahead and behind in one rev-list walk: --left-right --count on
+    # the symmetric difference prints "<ahead>\t<behind>". In the common
+    # up-to-date case both refs resolve to the same commit, which we can
+    # see from the already-loaded refs without spawning rev-list.
+    try:
+        if repo.commit(branch).hexsha == repo.commit(upstream_branch).hexsha:
+            ahead_count = behind_count = 0
+        else:
+            counts = repo.git.rev_list(
+                "--left-right", "--count", f"{branch}...{upstream_branch}"
+            )
+            ahead_count, behind_count = (int(part) for part in counts.split())
+    except Exception as e:
+        print(f"Error: Could not compare with {upstream_branch}: {e}")
         return False
-    
+
     if behind_count > 0:
         print(f"Error: Local branch is {behind_count} commits behind {upstream_branch}")
         print("Please pull the latest changes first")
         return False
-    
-    # Check if local is ahead of remote
-    success, ahead_count, error = count_commits_between(module_dir, upstream_branch, branch)
-    if not success:
-        print(f"Error: Could not check if ahead of remote: {error}")
-        return False
-    
+
     if ahead_count > 0:
         print(f"Error: Local branch is {ahead_count} commits ahead of {upstream_branch}")
         print("Please push or reset your local changes first")
         return False
-    
+
     print("✓ Git status is clean and up-to-date")
     return True
 
@@ -130,8 +158,7 @@ def read_module_bazel_version(module_bazel_path: Path) -> Optional[str]:
             content = f.read()
         
         # Match: module(name = "...", version = "x.y.z")
-        pattern = r'module\s*\(\s*name\s*=\s*"[^"]+"\s*,\s*version\s*=\s*"([^"]+)"\s*\)'
-        match = re.search(pattern, content)
+        match = _MODULE_VERSION_PATTERN.search(content)
         
         if match:
             return match.group(1)
@@ -170,16 +197,21 @@ def update_module_bazel_version(module_bazel_path: Path, new_version: str) -> bo
             content = f.read()
         
         # Replace version in module() declaration
-        pattern = r'(module\s*\(\s*name\s*=\s*"[^"]+"\s*,\s*version\s*=\s*")[^"]+(")'
-        updated_content = re.sub(pattern, rf'\g<1>{new_version}\g<2>', content)
+        updated_content = _MODULE_VERSION_SUB_PATTERN.sub(
+            rf'\g<1>{new_version}\g<2>', content
+        )
         
         if updated_content == content:
             print(f"Warning: No changes made to MODULE.bazel")
             return False
-        
-        with open(module_bazel_path, 'w', encoding='utf-8') as f:
+
+        # Write to a temp file and rename into place so a crash mid-write
+        # cannot leave a truncated MODULE.bazel behind.
+        tmp_path = module_bazel_path.with_suffix(".bazel.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             f.write(updated_content)
-        
+        os.replace(tmp_path, module_bazel_path)
+
         print(f"✓ Updated MODULE.bazel version to {new_version}")
         return True
         
@@ -196,12 +228,13 @@ def run_bazel_tests(module_dir: Path) -> bool:
     print(f"\nRunning bazel tests in {module_dir}...")
     
     try:
-        # Run bazel test with explicit bazelrc to use user's cache settings
+        # Run bazel test with explicit bazelrc to use user's cache settings.
+        # Resolve and stat the bazelrc once; both the test and the clean
+        # invocation below reuse the result.
         home_bazelrc = os.path.expanduser("~/.bazelrc")
-        bazel_cmd = ["bazel", "test", "..."]
-        if os.path.exists(home_bazelrc):
-            bazel_cmd.insert(1, f"--bazelrc={home_bazelrc}")
-        
+        bazelrc_args = [f"--bazelrc={home_bazelrc}"] if os.path.exists(home_bazelrc) else []
+        bazel_cmd = ["bazel", *bazelrc_args, "test", "..."]
+
         result = subprocess.run(
             bazel_cmd,
             cwd=module_dir,
@@ -217,9 +250,7 @@ def run_bazel_tests(module_dir: Path) -> bool:
         
         # Clean up
         print("Cleaning up bazel artifacts...")
-        clean_cmd = ["bazel", "clean"]
-        if os.path.exists(home_bazelrc):
-            clean_cmd.insert(1, f"--bazelrc={home_bazelrc}")
+        clean_cmd = ["bazel", *bazelrc_args, "clean"]
         subprocess.run(
             clean_cmd,
             cwd=module_dir,
@@ -234,7 +265,7 @@ def run_bazel_tests(module_dir: Path) -> bool:
         return False
 
 
-def pre_release(module_name: str, bump_type: str, skip_tests: bool = False) -> bool:
+def pre_release(module_name: str, bump_type: str, skip_tests: bool = False, assume_yes: bool = False) -> bool:
     """
     Prepare a module for release.
     
@@ -249,8 +280,13 @@ def pre_release(module_name: str, bump_type: str, skip_tests: bool = False) -> b
     print(f"Preparing {module_name} for release")
     print(f"Module directory: {module_dir}")
     
-    # Validate module directory
-    if not module_dir.exists() or not module_dir.is_dir():
+    # Validate module directory with one stat call (exists + is_dir each
+    # stat separately)
+    try:
+        if not stat.S_ISDIR(os.stat(module_dir).st_mode):
+            print(f"Error: Module directory does not exist: {module_dir}")
+            return False
+    except OSError:
         print(f"Error: Module directory does not exist: {module_dir}")
         return False
     
@@ -280,8 +316,7 @@ def pre_release(module_name: str, bump_type: str, skip_tests: bool = False) -> b
     print(f"New version: {new_version}")
     
     # Confirm with user
-    response = input(f"\nProceed with version bump {current_version} -> {new_version}? [y/N] ")
-    if response.lower() != 'y':
+    if not confirm(f"\nProceed with version bump {current_version} -> {new_version}? [y/N] ", assume_yes):
         print("Aborted by user")
         return False
     
@@ -307,8 +342,7 @@ def pre_release(module_name: str, bump_type: str, skip_tests: bool = False) -> b
     if not skip_tests:
         if not run_bazel_tests(module_dir):
             print("\nWarning: Tests failed. Do you want to continue anyway?")
-            response = input("Continue with commit and push? [y/N] ")
-            if response.lower() != 'y':
+            if not confirm("Continue with commit and push? [y/N] ", assume_yes):
                 print("Aborted. Changes are staged but not committed.")
                 return False
     else:
@@ -320,13 +354,20 @@ def pre_release(module_name: str, bump_type: str, skip_tests: bool = False) -> b
     
     try:
         repo = git.Repo(module_dir)
+        existing_files = []
         for file in files_to_add:
             file_path = module_dir / file
             if file_path.exists():
-                repo.index.add([str(file)])
-                print(f"  Staged: {file}")
+                existing_files.append(file)
             else:
                 print(f"  Warning: {file} not found, skipping")
+
+        if existing_files:
+            # Stage everything with one index write instead of reacquiring
+            # the index lock per file
+            repo.index.add(existing_files)
+            for file in existing_files:
+                print(f"  Staged: {file}")
     except Exception as e:
         print(f"Error staging files: {str(e)}")
         return False
@@ -405,10 +446,16 @@ Example: python3 roo-registry/bin/pre_release.py roo_display --patch
         action="store_true",
         help="Skip running bazel tests"
     )
-    
+
+    parser.add_argument(
+        "--yes", "-y",
+        action="store_true",
+        help="Answer yes to all confirmation prompts"
+    )
+
     args = parser.parse_args()
-    
-    success = pre_release(args.module_name, args.bump_type, args.skip_tests)
+
+    success = pre_release(args.module_name, args.bump_type, args.skip_tests, args.yes)
     
     sys.exit(0 if success else 1)
 
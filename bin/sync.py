@@ -13,91 +13,119 @@ Usage: python3 roo-registry/bin/sync.py
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Tuple, Dict
 
 # Add the bin directory to the path to import module_utils
 sys.path.insert(0, str(Path(__file__).parent))
 from module_utils import (
-    get_git_status, has_unpushed_commits, 
+    fetch_all, get_repo_state,
     has_remote_changes, git_push, git_pull_rebase, git_clone
 )
 
 
-def sync_repository(repo_path: Path, repo_name: str, clone_url: str = None) -> Tuple[bool, List[str]]:
+def sync_repository(repo_path: Path, repo_name: str, clone_url: str = None, prefetched: bool = False) -> Tuple[bool, List[str], str]:
     """
     Sync a single repository.
-    Returns (overall_success, list_of_error_messages).
+
+    Pass prefetched=True when the repository's remote refs were already
+    refreshed (see fetch_all); the dirty-tree fallback check then skips
+    its own fetch round-trip.
+
+    The status line is returned rather than printed so that repositories
+    synced concurrently on a thread pool do not interleave their output;
+    the caller prints each line whole. The uncommitted-changes list is
+    returned as well, so the summary does not have to query every
+    repository a second time.
+    Returns (overall_success, list_of_error_messages, status_line,
+    uncommitted_changes).
     """
     error_messages = []
-    
+    status_line = f"Syncing {repo_name} ..."
+
     # Check if repository exists, clone if missing
     if not repo_path.exists():
         if clone_url:
-            print(f"Syncing {repo_name} ... cloning", end="", flush=True)
+            status_line += " cloning"
             clone_success, clone_msg = git_clone(clone_url, repo_path)
             if not clone_success:
-                print(" ✗")
-                return False, [f"{repo_name}: {clone_msg}"]
-            print(" cloned", end="", flush=True)
+                return False, [f"{repo_name}: {clone_msg}"], status_line + " ✗", []
+            status_line += " cloned"
         else:
-            print(f"Syncing {repo_name} ... ✗")
-            return False, [f"{repo_name}: Directory does not exist and no clone URL provided"]
-    else:
-        print(f"Syncing {repo_name} ...", end="", flush=True)
-    
+            return (
+                False,
+                [f"{repo_name}: Directory does not exist and no clone URL provided"],
+                status_line + " ✗",
+                [],
+            )
+
     # Check if it's a git repository
-    if not (repo_path / ".git").exists():
-        print(" ✗")
-        return False, [f"{repo_name}: Not a git repository"]
-    
-    status_printed = False
-    
+    if not os.path.exists(os.path.join(repo_path, ".git")):
+        return False, [f"{repo_name}: Not a git repository"], status_line + " ✗", []
+
+    status_mark = None
+
     # Step 1: Pull with rebase first
     pull_success, pull_msg = git_pull_rebase(repo_path)
     if not pull_success:
         # Check if the failure is due to uncommitted changes and no remote changes
         if "unstaged changes" in pull_msg.lower() or "uncommitted changes" in pull_msg.lower():
-            has_remote, remote_info = has_remote_changes(repo_path)
+            # git pull --rebase checks for a clean work tree before it
+            # fetches, so the remote refs are still stale here unless the
+            # prefetch pass refreshed them; fetch when they weren't, to
+            # tell "nothing to pull" apart from a real conflict.
+            has_remote, remote_info = has_remote_changes(repo_path, fetch=not prefetched)
             if not has_remote and "No remote changes" in remote_info:
                 # No remote changes and pull failed due to local changes - this is OK
-                print(" OK")
-                status_printed = True
+                status_mark = " OK"
                 pull_success = True  # Treat as success for push check
             else:
                 # There are remote changes but can't pull due to local changes - this is a failure
-                print(" ✗")
-                status_printed = True
+                status_mark = " ✗"
                 error_messages.append(f"{repo_name}: {pull_msg}")
         else:
             # Other pull failure
-            print(" ✗")
-            status_printed = True
+            status_mark = " ✗"
             error_messages.append(f"{repo_name}: {pull_msg}")
-    
-    # Step 2: Check for unpushed commits and push if needed (only if pull succeeded)
+
+    # One repository-state query serves both the push check below and the
+    # uncommitted-changes summary at the end of the run (pull --rebase
+    # never changes which files are dirty).
+    state_success, state = get_repo_state(repo_path)
+    uncommitted = state["changes"] if state_success else []
+
+    # Step 2: Check for unpushed commits and push if needed (only if pull
+    # succeeded). get_repo_state reports branch, upstream and ahead/behind
+    # counts together, instead of separate git queries.
     if pull_success:
-        has_unpushed, push_info = has_unpushed_commits(repo_path)
-        if has_unpushed:
+        if not state_success:
+            if status_mark is None:
+                status_mark = " ⚠️"
+            error_messages.append(f"{repo_name}: {state['error']}")
+        elif state["branch"] is not None and state["upstream"] is None:
+            if status_mark is None:
+                status_mark = " ⚠️"
+            error_messages.append(
+                f"{repo_name}: No upstream branch configured for {state['branch']}"
+            )
+        elif state["ahead"] > 0:
             push_success, push_msg = git_push(repo_path)
             if not push_success:
-                if not status_printed:
-                    print(" ✗")
+                if status_mark is None:
+                    status_mark = " ✗"
                 error_messages.append(f"{repo_name}: {push_msg}")
             else:
-                if not status_printed:
-                    print(" OK")
+                if status_mark is None:
+                    status_mark = " OK"
         else:
-            # Check if push info indicates an issue
-            if "No upstream branch" in push_info or "Could not" in push_info:
-                if not status_printed:
-                    print(" ⚠️")
-                error_messages.append(f"{repo_name}: {push_info}")
-            else:
-                if not status_printed:
-                    print(" OK")
-    
-    return len(error_messages) == 0, error_messages
+            if status_mark is None:
+                status_mark = " OK"
+
+    if status_mark is not None:
+        status_line += status_mark
+
+    return len(error_messages) == 0, error_messages, status_line, uncommitted
 
 
 def find_module_directories(modules_dir: Path) -> List[Tuple[str, Path]]:
@@ -106,13 +134,16 @@ def find_module_directories(modules_dir: Path) -> List[Tuple[str, Path]]:
     Returns list of (module_name, module_path) tuples.
     """
     modules = []
-    if not modules_dir.exists():
+    try:
+        # scandir reuses the type information from the directory read, so
+        # no per-entry stat is needed.
+        with os.scandir(modules_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                    modules.append((entry.name, Path(entry.path)))
+    except FileNotFoundError:
         return modules
-    
-    for item in modules_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            modules.append((item.name, item))
-    
+
     return sorted(modules)
 
 
@@ -149,12 +180,17 @@ def main():
     
     # Track results
     failed_repos = {}  # repo_name -> list of error messages
+    modules_with_uncommitted = []  # (repo_name, changes), in completion order
     
-    # Step 1: Sync roo-registry repository
+    # Step 1: Sync roo-registry repository (on the main thread, before the
+    # modules: the module list below is read from its working tree)
     print("=" * 60)
-    registry_success, registry_errors = sync_repository(registry_dir, "roo-registry")
+    registry_success, registry_errors, registry_status, registry_uncommitted = sync_repository(registry_dir, "roo-registry")
+    print(registry_status)
     if not registry_success:
         failed_repos["roo-registry"] = registry_errors
+    if registry_uncommitted:
+        modules_with_uncommitted.append(("roo-registry", registry_uncommitted))
     
     # Step 2: Find tracked modules
     print("\n" + "=" * 60)
@@ -166,34 +202,54 @@ def main():
     module_repos = get_roo_module_paths(roo_dir, tracked_modules)
     print(f"Processing {len(module_repos)} modules")
     
-    # Step 4: Sync each module repository
+    # Step 4: Sync the module repositories concurrently. Each module has
+    # its own working tree and remote, and most of the wall time is spent
+    # blocked on network round-trips, so a thread pool brings the stage
+    # down to roughly the slowest repository. Status lines are printed in
+    # completion order.
     print("\n" + "=" * 60)
-    for module_name, module_path, clone_url in module_repos:
-        module_success, module_errors = sync_repository(module_path, module_name, clone_url)
-        if not module_success:
-            failed_repos[module_name] = module_errors
+    if module_repos:
+        # Prefetch remote refs for the existing module repositories in one
+        # concurrent pass, so a worker whose pull is blocked by a dirty
+        # tree can check for remote changes without fetching again.
+        # Repositories whose prefetch failed fetch at the call site instead.
+        existing_paths = [
+            path for _, path, _ in module_repos
+            if os.path.exists(os.path.join(path, ".git"))
+        ]
+        prefetch_errors = fetch_all(existing_paths)
+        prefetched_paths = set(existing_paths) - set(prefetch_errors)
+
+        max_workers = min(16, len(module_repos))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    sync_repository, module_path, module_name, clone_url,
+                    module_path in prefetched_paths,
+                ): module_name
+                for module_name, module_path, clone_url in module_repos
+            }
+            for future in as_completed(futures):
+                module_name = futures[future]
+                module_success, module_errors, module_status, module_uncommitted = future.result()
+                print(module_status)
+                if not module_success:
+                    failed_repos[module_name] = module_errors
+                if module_uncommitted:
+                    modules_with_uncommitted.append((module_name, module_uncommitted))
     
     # Step 5: Generate summary
     print("=" * 60)
     print("SYNC SUMMARY")
     print("=" * 60)
     
-    # Check for uncommitted changes
+    # Report uncommitted changes collected during the sync pass; no extra
+    # git queries are needed here. Entries arrive in completion order, so
+    # sort them (registry first, then modules by name) for a stable summary.
+    modules_with_uncommitted.sort(
+        key=lambda entry: (entry[0] != "roo-registry", entry[0])
+    )
     print("\nModules with uncommitted changes:")
-    modules_with_uncommitted = []
-    
-    # Check roo-registry
-    has_changes, changes = get_git_status(registry_dir)
-    if has_changes:
-        modules_with_uncommitted.append(("roo-registry", changes))
-    
-    # Check each module
-    for module_name, module_path, _ in module_repos:
-        if module_path.exists():  # Only check if directory exists
-            has_changes, changes = get_git_status(module_path)
-            if has_changes:
-                modules_with_uncommitted.append((module_name, changes))
-    
     if modules_with_uncommitted:
         for repo_name, changes in modules_with_uncommitted:
             print(f"  {repo_name}:")
@@ -15,6 +15,8 @@ modules/
 import os
 import re
 import sys
+from collections import defaultdict
+from itertools import chain
 from typing import List, Tuple, Dict, Set
 from pathlib import Path
 
@@ -38,32 +40,36 @@ def get_modules_and_versions(modules_dir: Path) -> Dict[str, List[Version]]:
         print(f"Warning: '{modules_dir}' is not a directory.")
         return modules
     
-    # Iterate through each subdirectory (module) in the modules directory
-    for module_path in modules_dir.iterdir():
-        if not module_path.is_dir():
-            continue
-        
-        module_name = module_path.name
-        versions = []
-        
-        # Iterate through each subdirectory (version) in the module directory
-        for version_path in module_path.iterdir():
-            if not version_path.is_dir():
-                continue
-            
-            version_str = version_path.name
-            try:
-                version = Version(version_str)
-                versions.append(version)
-            except ValueError as e:
-                print(f"Warning: Skipping invalid version '{version_str}' for module '{module_name}': {e}")
+    # Iterate through each subdirectory (module) in the modules directory.
+    # scandir hands back the entry type from the directory read itself, so
+    # neither loop stats its entries again.
+    with os.scandir(modules_dir) as module_entries:
+        for module_entry in module_entries:
+            if not module_entry.is_dir(follow_symlinks=False):
                 continue
-        
-        if versions:
-            # Sort versions to make it easier to find the newest
-            versions.sort()
-            modules[module_name] = versions
-    
+
+            module_name = module_entry.name
+            versions = []
+
+            # Iterate through each subdirectory (version) in the module directory
+            with os.scandir(module_entry.path) as version_entries:
+                for version_entry in version_entries:
+                    if not version_entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    version_str = version_entry.name
+                    try:
+                        version = Version(version_str)
+                        versions.append(version)
+                    except ValueError as e:
+                        print(f"Warning: Skipping invalid version '{version_str}' for module '{module_name}': {e}")
+                        continue
+
+            if versions:
+                # No need to sort: find_newest_versions only takes max(),
+                # and the report only counts the versions.
+                modules[module_name] = versions
+
     return modules
 
 
@@ -152,84 +158,84 @@ def main():
     # Get dependencies for all newest versions
     all_dependencies = get_all_dependencies(modules_dir, newest_versions)
     
-    # Print results
-    print("\nModules and their newest versions:")
-    print("-" * 60)
-    
+    # Build the report in memory and write it with a single stdout call;
+    # hundreds of individual prints each take the stream lock and may
+    # flush, which dominates when output is redirected to a file.
+    out = []
+    out.append("\nModules and their newest versions:\n")
+    out.append("-" * 60 + "\n")
+
     # Track outdated dependencies for summary
-    outdated_deps_summary = {}
-    
+    outdated_deps_summary = defaultdict(
+        lambda: {'used_versions': set(), 'latest_version': None, 'used_by': []}
+    )
+
     # Sort modules by name for consistent output
     for module_name in sorted(newest_versions.keys()):
         newest_version = newest_versions[module_name]
         total_versions = len(modules[module_name])
         dependencies = all_dependencies.get(module_name, [])
-        
-        print(f"{module_name:<25} {newest_version} ({total_versions} version{'s' if total_versions != 1 else ''} available)")
-        
+
+        out.append(f"{module_name:<25} {newest_version} ({total_versions} version{'s' if total_versions != 1 else ''} available)\n")
+
         if dependencies:
-            print(f"{'':>25} Dependencies:")
-            
+            out.append(f"{'':>25} Dependencies:\n")
+
             # Check which dependencies are outdated
             checked_dependencies = check_dependency_versions(dependencies, newest_versions)
-            
+
             for dep, is_latest in checked_dependencies:
                 if is_latest:
-                    print(f"{'':>27} - {dep}")
+                    out.append(f"{'':>27} - {dep}\n")
                 else:
                     # Highlight outdated dependency
                     latest_version = newest_versions[dep.name]
-                    print(f"{'':>27} - {dep} *** OUTDATED (latest: {latest_version}) ***")
-                    
+                    out.append(f"{'':>27} - {dep} *** OUTDATED (latest: {latest_version}) ***\n")
+
                     # Track for summary
-                    if dep.name not in outdated_deps_summary:
-                        outdated_deps_summary[dep.name] = {
-                            'used_versions': set(),
-                            'latest_version': latest_version,
-                            'used_by': []
-                        }
-                    outdated_deps_summary[dep.name]['used_versions'].add(str(dep.version))
-                    outdated_deps_summary[dep.name]['used_by'].append(module_name)
+                    entry = outdated_deps_summary[dep.name]
+                    entry['latest_version'] = latest_version
+                    entry['used_versions'].add(str(dep.version))
+                    entry['used_by'].append(module_name)
         else:
-            print(f"{'':>25} No dependencies")
-        print()  # Empty line for readability
-    
-    print(f"Total modules found: {len(newest_versions)}")
-    
+            out.append(f"{'':>25} No dependencies\n")
+        out.append("\n")  # Empty line for readability
+
+    out.append(f"Total modules found: {len(newest_versions)}\n")
+
     # Summary of all unique dependencies
-    all_unique_deps = set()
-    for deps in all_dependencies.values():
-        for dep in deps:
-            all_unique_deps.add(dep.name)
-    
+    all_unique_deps = {dep.name for dep in chain.from_iterable(all_dependencies.values())}
+
     if all_unique_deps:
-        print(f"\nUnique dependencies across all modules:")
+        out.append(f"\nUnique dependencies across all modules:\n")
         for dep_name in sorted(all_unique_deps):
-            print(f"  - {dep_name}")
-        print(f"\nTotal unique dependencies: {len(all_unique_deps)}")
-    
+            out.append(f"  - {dep_name}\n")
+        out.append(f"\nTotal unique dependencies: {len(all_unique_deps)}\n")
+
     # Summary of outdated dependencies
     if outdated_deps_summary:
-        print(f"\n{'='*60}")
-        print("OUTDATED DEPENDENCIES SUMMARY:")
-        print(f"{'='*60}")
-        
+        out.append(f"\n{'='*60}\n")
+        out.append("OUTDATED DEPENDENCIES SUMMARY:\n")
+        out.append(f"{'='*60}\n")
+
         for dep_name in sorted(outdated_deps_summary.keys()):
             info = outdated_deps_summary[dep_name]
             used_versions = sorted(info['used_versions'])
             latest_version = info['latest_version']
             used_by = sorted(info['used_by'])
-            
-            print(f"\n{dep_name}:")
-            print(f"  Latest version: {latest_version}")
-            print(f"  Used versions:  {', '.join(used_versions)}")
-            print(f"  Used by:        {', '.join(used_by)}")
-        
-        print(f"\nTotal modules with outdated dependencies: {len(outdated_deps_summary)}")
+
+            out.append(f"\n{dep_name}:\n")
+            out.append(f"  Latest version: {latest_version}\n")
+            out.append(f"  Used versions:  {', '.join(used_versions)}\n")
+            out.append(f"  Used by:        {', '.join(used_by)}\n")
+
+        out.append(f"\nTotal modules with outdated dependencies: {len(outdated_deps_summary)}\n")
     else:
-        print(f"\n{'='*60}")
-        print("✓ All dependencies are using the latest versions!")
-        print(f"{'='*60}")
+        out.append(f"\n{'='*60}\n")
+        out.append("✓ All dependencies are using the latest versions!\n")
+        out.append(f"{'='*60}\n")
+
+    sys.stdout.write(''.join(out))
 
 
 if __name__ == "__main__":
@@ -21,10 +21,25 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# orjson is an optional accelerator for library.json parsing; the stdlib json
+# module is used when it is not installed. Writes stay on json.dump, which
+# controls the indent=4 formatting of the files.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the bin directory to the path to import module_utils
 sys.path.insert(0, str(Path(__file__).parent))
 from module_utils import parse_module_bazel, Dependency, Version
 
+# Compiled once at import; library.properties is a line-oriented key=value
+# format, and these let the update run as whole-content regex passes
+# instead of a Python-level loop over every line.
+_PROPERTIES_VERSION_PATTERN = re.compile(r'^version=(.*)$', re.MULTILINE)
+_PROPERTIES_DEPENDS_PATTERN = re.compile(r'^depends=.*\n?', re.MULTILINE)
+_PROPERTIES_NAME_PATTERN = re.compile(r'^name=.*$', re.MULTILINE)
+
 
 def get_latest_versions_from_registry(registry_dir: Path) -> Dict[str, Version]:
     """
@@ -147,23 +162,31 @@ def update_library_json(library_json_path: Path, module_version: str, dependenci
         return True
     
     try:
-        # Read existing library.json
-        with open(library_json_path, 'r', encoding='utf-8') as f:
-            library_data = json.load(f)
-        
+        # Read existing library.json; the raw bytes are kept to detect
+        # whether the rewrite below would actually change the file.
+        with open(library_json_path, 'rb') as f:
+            original_bytes = f.read()
+        if orjson is not None:
+            library_data = orjson.loads(original_bytes)
+        else:
+            library_data = json.loads(original_bytes)
+
         print(f"Current library.json version: {library_data.get('version', 'unknown')}")
         
         # Update version
         library_data['version'] = module_version
         
-        # Filter to only roo dependencies (exclude external ones like nanopb and roo_testing)
-        roo_dependencies = [dep for dep in dependencies if dep.name.startswith('roo_') and dep.name != 'roo_testing']
-        
-        # Update dependencies in the existing format: "dejwk/<library_name>": ">=x.y.z"
+        # Filter to only roo dependencies (exclude external ones like nanopb
+        # and roo_testing), mapped to the existing format:
+        # "dejwk/<library_name>": ">=x.y.z"
+        roo_dependencies = {
+            f"dejwk/{dep.name}": f">={dep.version}"
+            for dep in dependencies
+            if dep.name.startswith('roo_') and dep.name != 'roo_testing'
+        }
+
         if roo_dependencies:
-            library_data['dependencies'] = {}
-            for dep in roo_dependencies:
-                library_data['dependencies'][f"dejwk/{dep.name}"] = f">={dep.version}"
+            library_data['dependencies'] = roo_dependencies
             print(f"Updated {len(roo_dependencies)} dependencies in library.json")
         else:
             # Remove dependencies section if no roo dependencies
@@ -171,10 +194,13 @@ def update_library_json(library_json_path: Path, module_version: str, dependenci
                 del library_data['dependencies']
             print("No roo dependencies found, removed dependencies section")
         
-        # Write updated library.json
-        with open(library_json_path, 'w', encoding='utf-8') as f:
-            json.dump(library_data, f, indent=4)
-        
+        # Write updated library.json, unless nothing changed: rewriting an
+        # identical file just dirties the mtime and git status.
+        updated_text = json.dumps(library_data, indent=4)
+        if updated_text.encode('utf-8') != original_bytes:
+            with open(library_json_path, 'w', encoding='utf-8') as f:
+                f.write(updated_text)
+
         print(f"✓ Updated library.json version to {module_version}")
         return True
         
@@ -199,63 +225,51 @@ def update_library_properties(library_properties_path: Path, module_version: str
         # Read existing library.properties
         with open(library_properties_path, 'r', encoding='utf-8') as f:
             content = f.read()
-        
-        lines = content.split('\n')
-        updated_lines = []
-        version_updated = False
-        depends_updated = False
-        
-        # Process each line
-        for line in lines:
-            if line.startswith('version='):
-                current_version = line.split('=', 1)[1] if '=' in line else 'unknown'
-                print(f"Current library.properties version: {current_version}")
-                updated_lines.append(f'version={module_version}')
-                version_updated = True
-                print(f"✓ Updated library.properties version to {module_version}")
-            elif line.startswith('depends='):
-                # Remove existing depends line - we'll add the new one later
-                depends_updated = True
-                continue
-            else:
-                updated_lines.append(line)
-        
+        original_content = content
+
+        # Rewrite the version line in place
+        version_match = _PROPERTIES_VERSION_PATTERN.search(content)
+        if version_match:
+            print(f"Current library.properties version: {version_match.group(1)}")
+            content = _PROPERTIES_VERSION_PATTERN.sub(f'version={module_version}', content)
+            print(f"✓ Updated library.properties version to {module_version}")
+
+        # Remove existing depends line(s) - we'll add the new one later
+        content = _PROPERTIES_DEPENDS_PATTERN.sub('', content)
+
         # Filter to only roo dependencies
-        roo_dependencies = [dep for dep in dependencies if dep.name.startswith('roo_') and dep.name != 'roo_testing']
-        
-        # Add new depends line if we have dependencies
-        if roo_dependencies:
-            dep_names = [dep.name for dep in roo_dependencies]
+        dep_names = [dep.name for dep in dependencies if dep.name.startswith('roo_') and dep.name != 'roo_testing']
+
+        # Add new depends line if we have dependencies, before any trailing
+        # blank lines
+        if dep_names:
             depends_line = f"depends={','.join(dep_names)}"
-            
-            # Insert depends line before the last empty line(s) if any
-            while updated_lines and updated_lines[-1] == '':
-                updated_lines.pop()
-            
-            updated_lines.append(depends_line)
-            print(f"Updated {len(roo_dependencies)} dependencies in library.properties")
+            stripped = content.rstrip('\n')
+            content = f"{stripped}\n{depends_line}" if stripped else depends_line
+            print(f"Updated {len(dep_names)} dependencies in library.properties")
         else:
             print("No roo dependencies found, removed depends field")
-        
+
         # Add version line if it wasn't found
-        if not version_updated:
+        if not version_match:
             # Insert version after name if possible, otherwise at the beginning
-            insert_pos = 0
-            for i, line in enumerate(updated_lines):
-                if line.startswith('name='):
-                    insert_pos = i + 1
-                    break
-            updated_lines.insert(insert_pos, f'version={module_version}')
+            version_line = f'version={module_version}'
+            name_match = _PROPERTIES_NAME_PATTERN.search(content)
+            if name_match:
+                insert_at = name_match.end()
+                content = f"{content[:insert_at]}\n{version_line}{content[insert_at:]}"
+            else:
+                content = f"{version_line}\n{content}"
             print(f"✓ Added version={module_version} to library.properties")
-        
-        # Write updated library.properties
-        updated_content = '\n'.join(updated_lines)
-        if not updated_content.endswith('\n'):
-            updated_content += '\n'
-        
-        with open(library_properties_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
-        
+
+        # Write updated library.properties, unless nothing changed
+        if not content.endswith('\n'):
+            content += '\n'
+
+        if content != original_content:
+            with open(library_properties_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+
         return True
         
     except Exception as e:
@@ -15,13 +15,35 @@ Options:
     --dry-run   Show what would be updated without making changes
 """
 
+import functools
 import os
 import re
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# orjson is an optional accelerator for library.json parsing; the stdlib json
+# module is used when it is not installed. Writes stay on json.dump, which
+# controls the indent=4 formatting of the files.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import; matches: module(name = "module_name", version = "x.y.z")
+_MODULE_PATTERN = re.compile(
+    r'module\s*\(\s*name\s*=\s*"([^"]+)"\s*,\s*version\s*=\s*"([^"]+)"\s*\)'
+)
+
+# Matches any bazel_dep line; the replacement decides per match whether the
+# captured name is one of ours, so a file is rewritten in a single scan
+# instead of one scan per known module.
+_BAZEL_DEP_PATTERN = re.compile(
+    r'(bazel_dep\s*\(\s*name\s*=\s*")([^"]+)("\s*,\s*version\s*=\s*")[^"]+(")'
+)
+
 
 def get_roo_directory() -> Path:
     """Get the roo directory path (two levels up from this script)."""
@@ -33,42 +55,56 @@ def get_roo_directory() -> Path:
 def find_roo_modules(roo_dir: Path) -> List[Path]:
     """Find all roo module directories (those containing MODULE.bazel)."""
     modules = []
-    
-    for item in roo_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            module_bazel = item / "MODULE.bazel"
-            if module_bazel.exists():
-                modules.append(item)
-    
+
+    # scandir carries the entry type from the directory read, so the only
+    # extra stat per candidate is the MODULE.bazel probe itself.
+    with os.scandir(roo_dir) as entries:
+        for entry in entries:
+            if (not entry.name.startswith('.')
+                    and entry.is_dir(follow_symlinks=False)
+                    and os.path.isfile(os.path.join(entry.path, "MODULE.bazel"))):
+                modules.append(Path(entry.path))
+
     return modules
 
 
+@functools.lru_cache(maxsize=None)
 def extract_module_version(module_dir: Path) -> Optional[Tuple[str, str]]:
-    """Extract module name and version from MODULE.bazel file."""
+    """
+    Extract module name and version from MODULE.bazel file.
+
+    Memoized: the discovery pass and the update pass both ask for the same
+    modules, so each MODULE.bazel is read and scanned at most once per run.
+    """
     module_bazel = module_dir / "MODULE.bazel"
-    
+
     if not module_bazel.exists():
         return None
-    
+
     try:
         content = module_bazel.read_text()
-        # Look for: module(name = "module_name", version = "x.y.z")
-        match = re.search(r'module\s*\(\s*name\s*=\s*"([^"]+)"\s*,\s*version\s*=\s*"([^"]+)"\s*\)', content)
+        match = _MODULE_PATTERN.search(content)
         if match:
             return match.group(1), match.group(2)
     except Exception as e:
         print(f"Error reading {module_bazel}: {e}")
-    
+
     return None
 
 
-def get_module_versions(roo_dir: Path) -> Dict[str, str]:
+def get_module_versions(modules: List[Path]) -> Dict[str, str]:
     """Get a mapping of module names to their current versions."""
-    modules = find_roo_modules(roo_dir)
     versions = {}
-    
-    for module_dir in modules:
-        version_info = extract_module_version(module_dir)
+    if not modules:
+        return versions
+
+    # The extraction is open+read+scan per file; a thread pool overlaps the
+    # I/O latency across modules. executor.map preserves input order, so
+    # the discovery output is unchanged.
+    with ThreadPoolExecutor(max_workers=min(32, len(modules))) as executor:
+        results = list(executor.map(extract_module_version, modules))
+
+    for module_dir, version_info in zip(modules, results):
         if version_info:
             name, version = version_info
             versions[name] = version
@@ -86,14 +122,23 @@ def update_module_bazel(module_bazel_path: Path, module_versions: Dict[str, str]
     
     try:
         content = module_bazel_path.read_text()
+
+        # Cheap substring pre-check: files with no bazel_dep lines at all
+        # (leaf modules) skip the regex pass entirely.
+        if 'bazel_dep' not in content:
+            return False
+
         original_content = content
-        
+
         # Update bazel_dep lines: bazel_dep(name = "module_name", version = "x.y.z")
-        for module_name, version in module_versions.items():
-            pattern = rf'(bazel_dep\s*\(\s*name\s*=\s*"{re.escape(module_name)}"\s*,\s*version\s*=\s*")[^"]+(")'
-            replacement = rf'\g<1>{version}\g<2>'
-            content = re.sub(pattern, replacement, content)
-        
+        def replace_version(match):
+            version = module_versions.get(match.group(2))
+            if version is None:
+                return match.group(0)
+            return match.group(1) + match.group(2) + match.group(3) + version + match.group(4)
+
+        content = _BAZEL_DEP_PATTERN.sub(replace_version, content)
+
         if content != original_content:
             if not dry_run:
                 module_bazel_path.write_text(content)
@@ -111,9 +156,13 @@ def update_library_json(library_json_path: Path, module_versions: Dict[str, str]
         return False
     
     try:
-        with open(library_json_path, 'r') as f:
-            data = json.load(f)
-        
+        if orjson is not None:
+            with open(library_json_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(library_json_path, 'r') as f:
+                data = json.load(f)
+
         if 'dependencies' not in data:
             return False
         
@@ -129,11 +178,11 @@ def update_library_json(library_json_path: Path, module_versions: Dict[str, str]
                     updated = True
         
         if updated and not dry_run:
+            # json.dump never emits a trailing newline, so append it in the
+            # same write pass instead of re-reading and rewriting the file.
             with open(library_json_path, 'w') as f:
                 json.dump(data, f, indent=4, ensure_ascii=False)
-            # Add newline at end if not present
-            if not library_json_path.read_text().endswith('\n'):
-                library_json_path.write_text(library_json_path.read_text() + '\n')
+                f.write('\n')
         
         return updated
     
@@ -143,10 +192,8 @@ def update_library_json(library_json_path: Path, module_versions: Dict[str, str]
     return False
 
 
-def update_all_modules(roo_dir: Path, module_versions: Dict[str, str], dry_run: bool = False):
+def update_all_modules(modules: List[Path], module_versions: Dict[str, str], dry_run: bool = False):
     """Update all modules with the current versions."""
-    modules = find_roo_modules(roo_dir)
-    
     for module_dir in modules:
         module_name = extract_module_version(module_dir)
         if module_name:
@@ -188,9 +235,11 @@ def main():
         print(f"Error: Roo directory {roo_dir} does not exist")
         return 1
     
-    # Discover all modules and their versions
+    # Discover all modules and their versions; the module list is reused
+    # by the update pass below rather than re-scanning the directory.
     print("\nDiscovering modules...")
-    module_versions = get_module_versions(roo_dir)
+    modules = find_roo_modules(roo_dir)
+    module_versions = get_module_versions(modules)
     
     if not module_versions:
         print("No modules found!")
@@ -203,7 +252,7 @@ def main():
     # Update all modules
     update_action = "Checking for updates..." if dry_run else "Updating module references..."
     print(f"\n{update_action}")
-    update_all_modules(roo_dir, module_versions, dry_run)
+    update_all_modules(modules, module_versions, dry_run)
     
     print("\nDone!")
     return 0